@@ -0,0 +1,4 @@
+"""
+Benchmarks da apresentação. Execute a partir da raiz do repositório, ex.:
+python -m benchmarks.bench_comissao
+"""
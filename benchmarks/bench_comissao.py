@@ -0,0 +1,83 @@
+"""
+Benchmark: comissão linha a linha (DataFrame.apply) vs vetorizada vs regras
+compiladas (config/regras_comissao.json).
+
+Antes de medir, confere em dados aleatórios que as três versões dão o mesmo
+resultado. Execute com:
+
+    python -m benchmarks.bench_comissao            # 10^6 linhas
+    python -m benchmarks.bench_comissao --linhas 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from nucleo.comissao import calcular_comissao, calcular_comissao_vetorizada, aplicar_comissao
+from nucleo.regras import carregar_regras, compilar
+
+REGRAS = carregar_regras('config/regras_comissao.json')
+
+
+def gerar_vendas(n, seed=0):
+    rng = np.random.default_rng(seed)
+    meta = rng.integers(1_000, 30_000, n)
+    # Vendas em torno da meta, incluindo os limites exatos de 100% e 120%
+    vendas = (meta * rng.choice([0.5, 0.9, 1.0, 1.1, 1.2, 1.5], n)).round()
+    vendas = vendas + rng.integers(-1, 2, n) * rng.integers(0, 2, n)
+    return pd.DataFrame({
+        'vendas': vendas,
+        'meta': meta,
+        'nivel': rng.choice(['Junior', 'Pleno', 'Senior'], n),
+        'categoria': rng.choice(['Standard', 'Premium'], n),
+    })
+
+
+def conferir_equivalencia(n=20_000, rodadas=5):
+    for seed in range(rodadas):
+        df = gerar_vendas(n, seed)
+        esperado = df.apply(calcular_comissao, axis=1).to_numpy()
+        for nome, obtido in [('vetorizada', aplicar_comissao(df)), ('regras', compilar(REGRAS)(df))]:
+            if not np.array_equal(esperado, obtido):
+                diferentes = np.flatnonzero(esperado != obtido)
+                raise AssertionError(
+                    f"Divergência ({nome}) na seed {seed}: {len(diferentes)} linhas, ex.:\n"
+                    f"{df.iloc[diferentes[:5]]}"
+                )
+    print(f"✅ Vetorizada e regras == linha a linha em {rodadas} x {n:,} linhas aleatórias")
+
+
+def medir(func, repeticoes=1):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--linhas', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    conferir_equivalencia()
+
+    df = gerar_vendas(args.linhas)
+    t_apply = medir(lambda: df.apply(calcular_comissao, axis=1))
+    t_vetor = medir(lambda: calcular_comissao_vetorizada(df['vendas'], df['meta'], df['nivel'], df['categoria']),
+                    repeticoes=5)
+    avaliador = compilar(REGRAS)
+    t_regras = medir(lambda: avaliador(df), repeticoes=5)
+
+    print(f"Linhas: {args.linhas:,}")
+    print(f"  apply(axis=1): {t_apply:8.3f} s")
+    print(f"  vetorizada:    {t_vetor:8.3f} s")
+    print(f"  regras:        {t_regras:8.3f} s")
+    print(f"  speedup:       {t_apply / t_vetor:8.1f}x (vetorizada), {t_apply / t_regras:.1f}x (regras)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""
+Benchmark: como cada núcleo de dados escala de 1 mil a 10 milhões de linhas.
+
+Núcleos medidos (todos de nucleo/, sem Streamlit):
+
+- gerar: olist.gerar_amostra (dados simulados no esquema da OLIST);
+- derivar: olist.derivar (entrega_atrasada e interestadual);
+- compactar: esquema.compactar (o esquema em que as páginas trabalham);
+- nota_por_atraso / atraso_por_tipo: os dois groupby da página OLIST;
+- comissao: regras compiladas de config/regras_comissao.json;
+- csv / json: exportacao.exportar, como no botão de download.
+
+Cada par (núcleo, tamanho) roda em um processo Python novo, então o pico de
+memória (RSS) é só dele: "entrada" é o RSS com os dados de entrada já
+montados, "pico" o pico durante o núcleo (no Linux o pico é zerado depois
+de montar a entrada; em outros sistemas ele inclui a montagem). O tempo é o
+melhor de até --repeticoes execuções (menos, se elas já passarem de 1 s).
+Execute com:
+
+    python -m benchmarks.bench_escala                              # 1k, 100k, 1M e 10M linhas
+    python -m benchmarks.bench_escala --tamanhos 1000 100000 --nucleos csv json
+    python -m benchmarks.bench_escala --salvar escala.json
+"""
+
+import argparse
+import gc
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from nucleo import exportacao, olist
+from nucleo.esquema import compactar
+
+RAIZ = Path(__file__).resolve().parent.parent
+TAMANHOS = [1_000, 100_000, 1_000_000, 10_000_000]
+ORCAMENTO_REPETICOES = 1.0  # segundos: acima disso, não repete
+
+
+def _amostra(n):
+    return olist.gerar_amostra(n, seed=0)
+
+
+def _sem_derivadas(n):
+    return _amostra(n).drop(columns=['entrega_atrasada', 'interestadual'])
+
+
+def _compacta(n):
+    return compactar(_amostra(n))
+
+
+def _vendas(n):
+    from benchmarks.bench_comissao import gerar_vendas
+    return gerar_vendas(n)
+
+
+def _comissao(vendas):
+    from benchmarks.bench_comissao import REGRAS
+    from nucleo.regras import compilar
+    return compilar(REGRAS)(vendas)
+
+
+def _exportar(formato):
+    def executar(df):
+        exportacao.exportar(df, formato)
+    return executar
+
+
+# nome: (monta a entrada a partir de n, núcleo aplicado à entrada)
+NUCLEOS = {
+    'gerar': (lambda n: n, _amostra),
+    'derivar': (_sem_derivadas, olist.derivar),
+    'compactar': (_amostra, compactar),
+    'nota_por_atraso': (_compacta, lambda df: df.groupby('entrega_atrasada', observed=True)['nota']
+                        .agg(['mean', 'median', 'count'])),
+    'atraso_por_tipo': (_compacta, lambda df: df.groupby('interestadual', observed=True)['entrega_atrasada']
+                        .mean()),
+    'comissao': (_vendas, _comissao),
+    'csv': (_compacta, _exportar('csv')),
+    'json': (_compacta, _exportar('json')),
+}
+
+
+def _zerar_pico():
+    """No Linux, zera o pico de RSS do processo (VmHWM); em outros sistemas, não faz nada."""
+    gc.collect()
+    try:
+        with open('/proc/self/clear_refs', 'w') as arquivo:
+            arquivo.write('5')
+    except OSError:
+        pass
+
+
+def _pico_rss_mib():
+    try:
+        with open('/proc/self/status') as arquivo:
+            for linha in arquivo:
+                if linha.startswith('VmHWM:'):
+                    return int(linha.split()[1]) / 1024
+    except OSError:
+        pass
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa KiB; macOS, bytes
+    return pico / (1024 ** 2 if sys.platform == 'darwin' else 1024)
+
+
+def medir_nucleo(nome, n, repeticoes):
+    """Mede um núcleo neste processo (chamado no subprocesso)."""
+    montar, nucleo = NUCLEOS[nome]
+    entrada = montar(n)
+    _zerar_pico()
+    entrada_mib = _pico_rss_mib()
+    melhor, gasto = float('inf'), 0.0
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        nucleo(entrada)
+        duracao = time.perf_counter() - inicio
+        melhor, gasto = min(melhor, duracao), gasto + duracao
+        if gasto > ORCAMENTO_REPETICOES:
+            break
+    return {'segundos': melhor, 'entrada_mib': entrada_mib, 'pico_mib': _pico_rss_mib()}
+
+
+def rodar(nucleos, tamanhos, repeticoes):
+    linhas = []
+    for nome in nucleos:
+        for n in tamanhos:
+            processo = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_escala', '--medir', nome, str(n),
+                 '--repeticoes', str(repeticoes)],
+                cwd=RAIZ, capture_output=True, text=True,
+            )
+            if processo.returncode != 0:
+                # Morto por sinal (ex.: o OOM killer, -9) não deixa nada no stderr
+                erro = processo.stderr.strip().splitlines()
+                motivo = erro[-1] if erro else 'sem mensagem no stderr'
+                print(f"  ❌ {nome} · {n:,}: código {processo.returncode}: {motivo}", flush=True)
+                continue
+            resultado = json.loads(processo.stdout.strip().splitlines()[-1])
+            resultado.update(nucleo=nome, linhas=n, linhas_por_s=n / resultado['segundos'])
+            linhas.append(resultado)
+            print(f"  {nome:<16} {n:>12,} linhas {resultado['segundos'] * 1000:10.1f} ms "
+                  f"{resultado['linhas_por_s'] / 1e6:8.2f} M linhas/s  pico {resultado['pico_mib']:8.0f} MiB",
+                  flush=True)
+    return pd.DataFrame(linhas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=TAMANHOS, metavar='N')
+    parser.add_argument('--nucleos', nargs='+', default=list(NUCLEOS), choices=list(NUCLEOS), metavar='NOME',
+                        help=f"padrão: todos ({', '.join(NUCLEOS)})")
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--salvar', type=Path, help='grava os resultados neste JSON')
+    parser.add_argument('--medir', nargs=2, metavar=('NUCLEO', 'N'), help=argparse.SUPPRESS)  # uso interno
+    args = parser.parse_args()
+
+    if args.medir:
+        nome, n = args.medir
+        print(json.dumps(medir_nucleo(nome, int(n), args.repeticoes)))
+        return
+
+    print(f"Medindo {len(args.nucleos)} núcleos em {len(args.tamanhos)} tamanhos...")
+    resultados = rodar(args.nucleos, args.tamanhos, args.repeticoes)
+    if resultados.empty:
+        sys.exit(1)
+
+    # Onde a vazão cai com o tamanho, o núcleo parou de escalar linearmente;
+    # medições que falharam (ex.: memória esgotada) aparecem como NaN
+    tabela = resultados.pivot(index='nucleo', columns='linhas', values='linhas_por_s').reindex(args.nucleos)
+    print("\nVazão (M linhas/s):")
+    print((tabela / 1e6).round(2).to_string())
+    print("\nPico de memória acima da entrada (MiB):")
+    acima = resultados.assign(acima=resultados['pico_mib'] - resultados['entrada_mib'])
+    print(acima.pivot(index='nucleo', columns='linhas', values='acima').reindex(args.nucleos).round(0).to_string())
+
+    if args.salvar:
+        args.salvar.write_text(resultados.to_json(orient='records', indent=2))
+        print(f"\n💾 Resultados gravados em {args.salvar}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: exportação dos botões de download, por formato.
+
+Antes de medir, confere cada formato pelo caminho do botão: a função adiada
+de componentes.download é chamada e o retorno passa pela mesma conversão
+que o Streamlit faz no clique (convert_data_to_bytes_and_infer_mime). O
+arquivo lido de volta tem de ser igual ao DataFrame, com mais de um bloco
+para cobrir a emenda entre blocos. Excel só entra com openpyxl ou
+xlsxwriter instalados. Execute com:
+
+    python -m benchmarks.bench_exportacao            # 10^6 linhas
+    python -m benchmarks.bench_exportacao --linhas 100000
+"""
+
+import argparse
+import io
+import time
+
+import pandas as pd
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+from benchmarks.bench_comissao import gerar_vendas
+from componentes.download import adiado
+from nucleo import exportacao
+
+LEITORES = {
+    'csv': pd.read_csv,
+    'csv.gz': lambda arquivo: pd.read_csv(arquivo, compression='gzip'),
+    'json': pd.read_json,
+    'parquet': pd.read_parquet,
+    'xlsx': pd.read_excel,
+}
+
+
+def gerar_tabela(n, seed=0):
+    df = gerar_vendas(n, seed)
+    df.insert(0, 'vendedor', 'V' + pd.Series(range(n)).astype(str))
+    return df
+
+
+def baixar(df, formato):
+    """Bytes que o navegador receberia ao clicar no botão do formato."""
+    dados, _ = convert_data_to_bytes_and_infer_mime(
+        adiado(df, formato)(), unsupported_error=TypeError(f"{formato}: tipo não aceito pelo Streamlit"))
+    return dados
+
+
+def conferir_formatos(n=exportacao.LINHAS_POR_BLOCO + 1_000):
+    df = gerar_tabela(n)
+    formatos = exportacao.disponiveis()
+    for formato in formatos:
+        lido = LEITORES[formato](io.BytesIO(baixar(df, formato)))
+        try:
+            pd.testing.assert_frame_equal(lido, df, check_dtype=False)
+        except AssertionError as erro:
+            raise AssertionError(f"Divergência em {formato}:\n{erro}") from None
+        vazio = LEITORES[formato](io.BytesIO(baixar(df.iloc[:0], formato)))
+        if list(vazio.columns) != list(df.columns) and formato != 'json':
+            raise AssertionError(f"{formato} sem linhas perdeu o cabeçalho: {list(vazio.columns)}")
+    faltando = [f for f in exportacao.FORMATOS if f not in formatos]
+    print(f"✅ {', '.join(formatos)} == DataFrame em {n:,} linhas, pelo caminho do download"
+          + (f" (sem {', '.join(faltando)}: dependência ausente)" if faltando else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--linhas', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    conferir_formatos()
+
+    df = gerar_tabela(args.linhas)
+    print(f"Linhas: {args.linhas:,}")
+    for formato in exportacao.disponiveis():
+        if formato == 'xlsx' and args.linhas > exportacao.LINHAS_EXCEL:
+            continue
+        inicio = time.perf_counter()
+        dados = baixar(df, formato)
+        print(f"  {formato:8} {time.perf_counter() - inicio:8.3f} s  {len(dados) / 2**20:8.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+"""
+Benchmark: custo de rerun de cada página da apresentação, sem navegador,
+pelo AppTest do Streamlit (streamlit.testing.v1).
+
+Cada cenário roda em um processo Python novo, para que imports e caches
+(st.cache_data/st.cache_resource) comecem frios e o pico de memória seja
+só dele. Mede:
+
+- frio_ms: o primeiro rerun da página, com os caches vazios (a execução
+  inicial do app, que importa tudo na página inicial, fica de fora);
+- acao_ms: o rerun causado pela interação do cenário, se houver;
+- quente_p50_ms / quente_p95_ms: reruns seguintes, sem mudar nada;
+- pico_rss_mib: pico de memória residente do processo.
+
+As abas (st.tabs) são todas executadas em cada rerun, então cada cenário
+cobre todas as abas da página. Execute com:
+
+    python -m benchmarks.bench_paginas                          # mede e mostra
+    python -m benchmarks.bench_paginas --salvar base.json       # grava a linha de base
+    python -m benchmarks.bench_paginas --comparar base.json     # acusa regressões
+    python -m benchmarks.bench_paginas --comparar base.json --limite 0.3 --cenarios "OLIST: filtro"
+
+Com --comparar, sai com código 1 se alguma métrica piorar mais que
+--limite (fração) e mais que --minimo-ms (ou --minimo-mib, para memória).
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+RAIZ = Path(__file__).resolve().parent.parent
+APP = RAIZ / 'apr_sl.py'
+METRICAS_MS = ['frio_ms', 'acao_ms', 'quente_p50_ms', 'quente_p95_ms']
+
+
+def _widget(lista, rotulo):
+    return next(w for w in lista if w.label == rotulo)
+
+
+def _primeiro_mes(slider):
+    inicio = slider.value[0]
+    return slider.set_value((inicio, inicio + datetime.timedelta(days=30)))
+
+
+# nome: (título da página em paginas.PAGINAS, interação ou None)
+CENARIOS = {
+    'Início': ('🏠 Início', None),
+    'O que é': ('🤔 O que é Streamlit?', None),
+    'Streamlit vs Power BI': ('⚔️ Streamlit vs Power BI', None),
+    'OLIST': ('🎯 Quando usar cada um', None),
+    'OLIST: filtro': ('🎯 Quando usar cada um',
+                      lambda at: _widget(at.multiselect, 'Estado do cliente').set_value(['SP'])),
+    'OLIST: métrica do mapa': ('🎯 Quando usar cada um',
+                               lambda at: _widget(at.radio, 'Métrica').set_value('frete_medio')),
+    'OLIST: reamostras': ('🎯 Quando usar cada um',
+                          lambda at: _widget(at.select_slider, 'Reamostras bootstrap').set_value(10000)),
+    'ETL': ('🔄 Caso: ETL + Dashboard', None),
+    'ETL: regras editadas': ('🔄 Caso: ETL + Dashboard',
+                             lambda at: at.text_area(key='regras_comissao_json').set_value(
+                                 at.text_area(key='regras_comissao_json').value.replace('0.1', '0.12', 1))),
+    'Demo': ('🔥 Demo ao Vivo', None),
+    'Demo: modo ao vivo': ('🔥 Demo ao Vivo', lambda at: at.toggle(key='demo_modo_ao_vivo').set_value(True)),
+    'Demo: período da série': ('🔥 Demo ao Vivo',
+                               lambda at: _primeiro_mes(at.slider(key='demo_serie_periodo'))),
+    'Como publicar': ('☁️ Como Publicar', None),
+    'Conclusão': ('🎓 Conclusão', None),
+}
+
+
+def _rerun(at):
+    inicio = time.perf_counter()
+    at.run()
+    duracao = (time.perf_counter() - inicio) * 1000
+    if at.exception:
+        raise RuntimeError('; '.join(e.message for e in at.exception))
+    return duracao
+
+
+def _pico_rss_mib():
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa KiB; macOS, bytes
+    return pico / (1024 ** 2 if sys.platform == 'darwin' else 1024)
+
+
+def medir_cenario(nome, quentes):
+    """Executa o cenário neste processo (chamado no subprocesso)."""
+    from streamlit.testing.v1 import AppTest
+
+    pagina, acao = CENARIOS[nome]
+    at = AppTest.from_file(str(APP), default_timeout=600)
+    at.run()
+    at.sidebar.radio[0].set_value(pagina)
+    resultado = {'frio_ms': _rerun(at), 'acao_ms': None}
+    if acao is not None:
+        acao(at)
+        resultado['acao_ms'] = _rerun(at)
+    tempos = [_rerun(at) for _ in range(quentes)]
+    resultado.update(quente_p50_ms=float(np.percentile(tempos, 50)),
+                     quente_p95_ms=float(np.percentile(tempos, 95)),
+                     pico_rss_mib=_pico_rss_mib())
+    return resultado
+
+
+def rodar(cenarios, quentes):
+    resultados = {}
+    for nome in cenarios:
+        processo = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_paginas', '--cenario', nome, '--quentes', str(quentes)],
+            cwd=RAIZ, capture_output=True, text=True,
+        )
+        if processo.returncode != 0:
+            raise RuntimeError(f"Cenário {nome!r} falhou:\n{processo.stderr[-2000:]}")
+        resultados[nome] = json.loads(processo.stdout.strip().splitlines()[-1])
+        print(f"  {nome:<28} frio {resultados[nome]['frio_ms']:8.0f} ms · "
+              f"quente p50 {resultados[nome]['quente_p50_ms']:6.0f} ms", flush=True)
+    return resultados
+
+
+def metadados():
+    import streamlit
+    return {
+        'data': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'pandas': pd.__version__,
+        'maquina': platform.node(),
+    }
+
+
+def comparar(atual, base, limite, minimo_ms, minimo_mib):
+    """Linhas (cenário, métrica, base, atual, variação) que pioraram além dos limites."""
+    regressoes = []
+    for nome, resultado in atual.items():
+        referencia = base.get(nome)
+        if referencia is None:
+            continue
+        for metrica in METRICAS_MS + ['pico_rss_mib']:
+            novo, antigo = resultado.get(metrica), referencia.get(metrica)
+            if novo is None or antigo is None:
+                continue
+            minimo = minimo_mib if metrica == 'pico_rss_mib' else minimo_ms
+            if novo > antigo * (1 + limite) and novo - antigo > minimo:
+                regressoes.append((nome, metrica, antigo, novo, novo / antigo - 1 if antigo else float('inf')))
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cenarios', nargs='*', default=list(CENARIOS), metavar='NOME',
+                        help='cenários a rodar (padrão: todos)')
+    parser.add_argument('--quentes', type=int, default=10, help='reruns quentes por cenário')
+    parser.add_argument('--salvar', type=Path, help='grava os resultados neste JSON')
+    parser.add_argument('--comparar', type=Path, help='JSON de linha de base para comparar')
+    parser.add_argument('--limite', type=float, default=0.2, help='piora relativa tolerada (0.2 = 20%%)')
+    parser.add_argument('--minimo-ms', type=float, default=5.0, help='piora absoluta mínima para acusar (ms)')
+    parser.add_argument('--minimo-mib', type=float, default=10.0, help='piora absoluta mínima de memória (MiB)')
+    parser.add_argument('--cenario', help=argparse.SUPPRESS)  # uso interno: roda um cenário e imprime JSON
+    args = parser.parse_args()
+
+    if args.cenario:
+        print(json.dumps(medir_cenario(args.cenario, args.quentes)))
+        return
+
+    desconhecidos = set(args.cenarios) - set(CENARIOS)
+    if desconhecidos:
+        parser.error(f"cenários desconhecidos: {', '.join(sorted(desconhecidos))}")
+
+    print(f"Rodando {len(args.cenarios)} cenários ({args.quentes} reruns quentes cada)...")
+    resultados = rodar(args.cenarios, args.quentes)
+    print()
+    print(pd.DataFrame(resultados).T.round(1).to_string())
+
+    if args.salvar:
+        args.salvar.write_text(json.dumps({'meta': metadados(), 'cenarios': resultados}, indent=2,
+                                          ensure_ascii=False))
+        print(f"\n💾 Resultados gravados em {args.salvar}")
+
+    if args.comparar:
+        base = json.loads(args.comparar.read_text())
+        regressoes = comparar(resultados, base['cenarios'], args.limite, args.minimo_ms, args.minimo_mib)
+        print(f"\nComparação com {args.comparar} ({base['meta']['data']}, limite {args.limite:.0%}):")
+        if not regressoes:
+            print("✅ Nenhuma regressão")
+            return
+        for nome, metrica, antigo, novo, variacao in regressoes:
+            print(f"❌ {nome} · {metrica}: {antigo:.1f} → {novo:.1f} ({variacao:+.0%})")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,3 @@
+"""
+Componentes Streamlit reutilizáveis pelas páginas da apresentação.
+"""
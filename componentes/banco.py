@@ -0,0 +1,73 @@
+"""
+Acesso a banco compartilhado pelo app: uma FonteSQL (nucleo.sql) por processo.
+
+Com uma seção [database] nos secrets, as conexões vêm do driver DB-API
+indicado nela; as demais chaves vão para driver.connect():
+
+    [database]
+    driver = "psycopg"      # módulo DB-API
+    marcador = "%s"         # placeholder de parâmetro do driver
+    ttl = 600               # segundos em cache (opcional)
+    host = "seu-servidor"
+    password = "sua-senha-segura"
+
+Sem secrets, usa um SQLite local com a tabela "pedidos" montada a partir dos
+dados OLIST que o app já carrega (reais ou simulados).
+"""
+
+import importlib
+import os
+import sqlite3
+from pathlib import Path
+
+import streamlit as st
+
+from nucleo import esquema, olist
+from nucleo.sql import TTL_PADRAO, FonteSQL, PoolConexoes
+
+ARQUIVO_SQLITE = olist.CACHE_PADRAO / "olist.sqlite"
+CONEXOES = 4
+
+
+def _configuracao():
+    try:
+        return dict(st.secrets["database"]) if "database" in st.secrets else None
+    except FileNotFoundError:
+        return None
+
+
+def montar_sqlite(df, arquivo=ARQUIVO_SQLITE):
+    """Grava `df` como a tabela pedidos (com índices nos estados) no SQLite local."""
+    arquivo = Path(arquivo)
+    arquivo.parent.mkdir(parents=True, exist_ok=True)
+    # Arquivo temporário + troca atômica: conexões abertas seguem lendo o antigo
+    temporario = arquivo.with_suffix(f".{os.getpid()}.tmp")
+    temporario.unlink(missing_ok=True)
+    conexao = sqlite3.connect(temporario)
+    with conexao:
+        esquema.expandir(df).to_sql("pedidos", conexao, index=False, chunksize=50_000)
+        for coluna in ("estado_cliente", "estado_vendedor", "data_compra"):
+            conexao.execute(f'CREATE INDEX "pedidos_{coluna}" ON pedidos ("{coluna}")')
+    conexao.close()
+    os.replace(temporario, arquivo)
+
+
+# A fonte que sai do cache (outra versão dos dados) fecha suas conexões
+@st.cache_resource(show_spinner=False, max_entries=2, on_release=lambda fonte: fonte.fechar())
+def fonte(versao_olist=None, _pedidos=None):
+    """
+    A FonteSQL do processo, com seu pool de conexões e cache. Sem secrets,
+    o SQLite local é montado com `_pedidos` (ou a amostra simulada) uma vez
+    por versão dos dados OLIST.
+    """
+    configuracao = _configuracao()
+    if configuracao is not None:
+        driver = importlib.import_module(configuracao.pop("driver"))
+        marcador = configuracao.pop("marcador", "?")
+        ttl = configuracao.pop("ttl", TTL_PADRAO)
+        pool = PoolConexoes(lambda: driver.connect(**configuracao), CONEXOES)
+        return FonteSQL(pool, ttl=ttl, marcador=marcador)
+
+    montar_sqlite(olist.gerar_amostra() if _pedidos is None else _pedidos)
+    pool = PoolConexoes(lambda: sqlite3.connect(ARQUIVO_SQLITE, check_same_thread=False), CONEXOES)
+    return FonteSQL(pool)
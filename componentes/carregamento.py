@@ -0,0 +1,70 @@
+"""
+Carregamento concorrente de fontes independentes, com lugares reservados.
+
+A página reserva o lugar de cada painel com um esqueleto (reservar), dispara
+as cargas em um pool de threads compartilhado pelo processo (disparar) e
+desenha cada painel assim que os dados dele chegam, na ordem de chegada
+(preencher). O primeiro conteúdo aparece quando chega a fonte mais rápida e
+a página fica completa com a mais lenta, em vez de esperar a soma de todas.
+
+As cargas rodam fora da thread do script, então devem ser funções de dados
+(nucleo/, funções com st.cache_data/st.cache_resource sem spinner), sem
+widgets, elementos ou session_state; só o desenho roda na thread do script.
+O ganho vem de fontes que esperam E/S (banco, rede, disco) ou de código que
+libera o GIL (NumPy, pandas, pyarrow).
+
+Com "🔬 Perfilar próximo rerun" armado, cada carga roda sob um cProfile
+próprio na thread do pool, somado ao perfil do rerun (componentes.diagnostico);
+a medição por trecho registra só a espera de cada painel ("carga: ...").
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import streamlit as st
+
+from componentes import diagnostico, medicao
+
+TRABALHADORES = 8
+
+
+@st.cache_resource
+def _executor():
+    """Pool de threads do processo, compartilhado por todas as sessões."""
+    return ThreadPoolExecutor(TRABALHADORES, thread_name_prefix="carregamento")
+
+
+def disparar(carregar, *args, **kwargs):
+    """Começa `carregar(*args, **kwargs)` em segundo plano; devolve o Future."""
+    return _executor().submit(diagnostico.envolver(carregar), *args, **kwargs)
+
+
+def reservar(texto="Carregando...", altura=300):
+    """st.empty() com um esqueleto no lugar do painel que ainda vai chegar."""
+    espaco = st.empty()
+    espaco.markdown(f'<div class="esqueleto" style="height: {altura}px">⏳ {texto}</div>',
+                    unsafe_allow_html=True)
+    return espaco
+
+
+def preencher(paineis):
+    """
+    Desenha cada painel (espaço, futuro, desenhar) quando o futuro termina:
+    `desenhar(resultado)` roda dentro do espaço reservado. A falha de uma
+    fonte vira um erro só no painel dela. Com a medição ligada, a espera de
+    cada painel (do início do preenchimento até a chegada dos dados) é
+    registrada como "carga: <nome de desenhar>".
+    """
+    inicio = time.perf_counter()
+    pendentes = {futuro: (espaco, desenhar) for espaco, futuro, desenhar in paineis}
+    for futuro in as_completed(pendentes):
+        espaco, desenhar = pendentes[futuro]
+        nome = getattr(desenhar, "__name__", None) or desenhar.func.__name__
+        medicao.registrar(f"carga: {nome}", time.perf_counter() - inicio)
+        try:
+            resultado = futuro.result()
+        except Exception as erro:
+            espaco.error(f"❌ Falha ao carregar: {erro}")
+            continue
+        with espaco.container():
+            desenhar(resultado)
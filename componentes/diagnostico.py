@@ -0,0 +1,168 @@
+"""
+Perfil de um único rerun com cProfile e tracemalloc, sob demanda.
+
+O botão "🔬 Perfilar próximo rerun" da barra lateral arma a captura: o
+rerun seguinte (causado por qualquer interação) roda sob cProfile e
+tracemalloc, e o resultado fica na sessão: funções com maior tempo
+acumulado, linhas que mais alocaram memória e o arquivo .prof para abrir
+no snakeviz, no pstats etc.
+
+O cProfile acompanha a thread do script desta sessão e as cargas que ela
+dispara no pool de componentes.carregamento (cada uma com seu próprio
+perfilador, somado ao do script no fim); o tempo do script esperando
+essas cargas aparece nas funções de espera. O tracemalloc é global ao
+processo, então reruns simultâneos de outras sessões também
+aparecem nas alocações. Por isso só uma captura roda por vez no processo:
+quem arma enquanto outra sessão captura recebe um aviso e tenta de novo.
+"""
+
+import cProfile
+import marshal
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+import streamlit as st
+
+TOP = 25
+QUADROS_TRACEMALLOC = 10
+
+_captura = threading.Lock()  # uma captura por processo: o tracemalloc e seu pico são globais
+
+
+def _recusar():
+    st.sidebar.warning("Outro perfil está em andamento; tente de novo em instantes.")
+
+
+def iniciar():
+    """Começa a captura se ela foi armada no rerun anterior."""
+    if not st.session_state.pop("_perfilar_proximo", False):
+        return
+    if not _captura.acquire(blocking=False):
+        _recusar()
+        return
+    iniciou_tracemalloc = not tracemalloc.is_tracing()
+    if iniciou_tracemalloc:
+        tracemalloc.start(QUADROS_TRACEMALLOC)
+    tracemalloc.reset_peak()
+    perfilador = cProfile.Profile()
+    try:
+        perfilador.enable()
+    except ValueError:  # outro perfilador ativo (Python 3.12+ só permite um por processo)
+        if iniciou_tracemalloc:
+            tracemalloc.stop()
+        _captura.release()
+        _recusar()
+        return
+    st.session_state["_perfilando"] = (perfilador, iniciou_tracemalloc, time.perf_counter(), [])
+
+
+def envolver(carregar):
+    """
+    `carregar` perfilado na thread em que rodar, se esta sessão está
+    capturando; senão, o próprio `carregar`. Chamado na thread do script.
+    """
+    perfilando = st.session_state.get("_perfilando")
+    if perfilando is None:
+        return carregar
+    perfis = perfilando[3]
+
+    def perfilado(*args, **kwargs):
+        perfilador = cProfile.Profile()
+        try:
+            perfilador.enable()
+        except ValueError:  # Python 3.12+: um perfilador por processo, o do script
+            return carregar(*args, **kwargs)
+        try:
+            return carregar(*args, **kwargs)
+        finally:
+            perfilador.disable()
+            perfis.append(perfilador)
+
+    return perfilado
+
+
+def _funcoes(estatisticas):
+    # pandas só quando há captura: as páginas só de texto não pagam a importação
+    import pandas as pd
+
+    linhas = []
+    for (arquivo, linha, funcao), (_, chamadas, proprio, acumulado, _) in estatisticas.stats.items():
+        linhas.append({
+            "função": funcao,
+            "local": f"{os.path.relpath(arquivo) if os.path.isabs(arquivo) else arquivo}:{linha}",
+            "chamadas": chamadas,
+            "próprio (ms)": proprio * 1000,
+            "acumulado (ms)": acumulado * 1000,
+        })
+    tabela = pd.DataFrame(linhas).sort_values("acumulado (ms)", ascending=False).head(TOP)
+    return tabela.round(2).reset_index(drop=True)
+
+
+def _alocacoes(foto):
+    import pandas as pd
+
+    linhas = [{
+        "local": f"{os.path.relpath(s.traceback[0].filename)}:{s.traceback[0].lineno}",
+        "KiB": s.size / 1024,
+        "blocos": s.count,
+    } for s in foto.statistics("lineno")[:TOP]]
+    return pd.DataFrame(linhas, columns=["local", "KiB", "blocos"]).round(1)
+
+
+def finalizar(pagina):
+    """
+    Encerra a captura (se houver) e guarda o resultado; desenha o botão e o
+    último perfil. Chamado num finally: a captura também fecha quando a
+    página falha ou o rerun é interrompido.
+    """
+    perfilando = st.session_state.pop("_perfilando", None)
+    if perfilando is not None:
+        perfilador, iniciou_tracemalloc, inicio, perfis = perfilando
+        perfilador.disable()
+        duracao = time.perf_counter() - inicio
+        try:
+            foto = tracemalloc.take_snapshot()
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            if iniciou_tracemalloc:
+                tracemalloc.stop()
+            _captura.release()
+
+        estatisticas = pstats.Stats(perfilador)
+        # Cargas que terminaram durante o rerun (componentes.carregamento)
+        for perfil in list(perfis):
+            estatisticas.add(perfil)
+        st.session_state["_diagnostico"] = {
+            "instante": datetime.now().strftime("%H:%M:%S"),
+            "pagina": pagina,
+            "duracao": duracao,
+            "pico": pico,
+            "funcoes": _funcoes(estatisticas),
+            "alocacoes": _alocacoes(foto),
+            # Mesmo formato de pstats.Stats.dump_stats / cProfile -o
+            "prof": marshal.dumps(estatisticas.stats),
+        }
+
+    with st.sidebar:
+        if st.button("🔬 Perfilar próximo rerun", help="Captura o próximo rerun com cProfile e tracemalloc"):
+            st.session_state["_perfilar_proximo"] = True
+        if st.session_state.get("_perfilar_proximo"):
+            st.caption("Armado: interaja com a página para capturar o rerun.")
+
+    diagnostico = st.session_state.get("_diagnostico")
+    if diagnostico is None:
+        return
+    with st.expander(f"🔬 Perfil do rerun das {diagnostico['instante']} ({diagnostico['pagina']})"):
+        st.caption(f"{diagnostico['duracao'] * 1000:,.0f} ms sob o cProfile · "
+                   f"pico de memória rastreada {diagnostico['pico'] / 1024 ** 2:,.1f} MiB")
+        st.markdown(f"**Top {TOP} funções por tempo acumulado**")
+        st.dataframe(diagnostico["funcoes"], use_container_width=True, hide_index=True)
+        st.markdown(f"**Top {TOP} linhas por memória alocada** (ainda viva no fim do rerun)")
+        st.dataframe(diagnostico["alocacoes"], use_container_width=True, hide_index=True)
+        st.download_button("📥 Baixar .prof", diagnostico["prof"], "rerun.prof",
+                           "application/octet-stream", on_click="ignore")
+        st.caption("Abra com `python -m pstats rerun.prof` ou `snakeviz rerun.prof`.")
@@ -0,0 +1,35 @@
+"""
+Botões de download que só geram o arquivo quando clicados.
+
+O st.download_button recebe uma função em vez do conteúdo: nada é
+serializado nos reruns comuns da página, e a exportação (em blocos, ver
+nucleo.exportacao) roda numa thread à parte só quando alguém clica.
+"""
+
+import functools
+
+import streamlit as st
+
+from nucleo import exportacao
+
+
+def adiado(df, formato):
+    """A função que o botão chama no clique: devolve os bytes de `df` no formato."""
+    return functools.partial(exportacao.exportar, df, formato)
+
+
+def botoes_download(df, nome, chave, formatos=None):
+    """Um botão por formato disponível, para baixar `df` como `nome`.<extensão>."""
+    formatos = formatos or exportacao.disponiveis()
+    for coluna, formato in zip(st.columns(len(formatos)), formatos):
+        info = exportacao.FORMATOS[formato]
+        with coluna:
+            st.download_button(
+                f"📥 {info.rotulo}",
+                data=adiado(df, formato),
+                file_name=f"{nome}.{info.extensao}",
+                mime=info.mime,
+                on_click="ignore",
+                key=f"{chave}_{formato}",
+                use_container_width=True,
+            )
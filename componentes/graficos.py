@@ -0,0 +1,133 @@
+"""
+Cache de figuras Plotly compartilhado entre sessões.
+
+Cada gráfico é descrito por uma função construtora (dados, **especificação)
+-> go.Figure. A chave do cache é o nome da construtora, um hash do conteúdo
+do DataFrame e a especificação; a figura pronta (objeto go.Figure já
+validado) fica num LRU limitado, único por processo. Com várias pessoas
+navegando pela apresentação ao mesmo tempo, figuras idênticas são
+construídas uma vez só. A serialização para o navegador continua a cada
+rerun: o st.plotly_chart não aceita um JSON pronto, e um dict seria
+validado de novo pelo Plotly.
+
+Séries temporais longas passam por exibir_serie: a faixa visível é
+reduzida com LTTB (nucleo.lttb) a cerca de um ponto por pixel antes de ir
+para o navegador, e cada faixa escolhida vira uma entrada do cache.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from componentes import medicao
+from nucleo.lttb import lttb
+
+TEMA_ESCURO = dict(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font_color='#e0e0e0')
+
+LARGURA_PIXELS = 1200
+LIMITE_WEBGL = 10_000  # pontos na faixa a partir dos quais o traço usa WebGL
+
+
+class CacheFiguras:
+    """LRU de figuras prontas, seguro para várias sessões (threads) ao mesmo tempo."""
+
+    def __init__(self, capacidade=256):
+        self.capacidade = capacidade
+        self.itens = OrderedDict()
+        self.trava = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+
+    def obter(self, chave, construir):
+        with self.trava:
+            if chave in self.itens:
+                self.itens.move_to_end(chave)
+                self.acertos += 1
+                return self.itens[chave]
+            self.faltas += 1
+
+        # Construída fora da trava para não bloquear as outras sessões
+        figura = construir()
+
+        with self.trava:
+            self.itens[chave] = figura
+            self.itens.move_to_end(chave)
+            while len(self.itens) > self.capacidade:
+                self.itens.popitem(last=False)
+        return figura
+
+    def estatisticas(self):
+        with self.trava:
+            return {'itens': len(self.itens), 'capacidade': self.capacidade,
+                    'acertos': self.acertos, 'faltas': self.faltas}
+
+
+@st.cache_resource
+def cache_figuras():
+    """A instância única do cache, compartilhada por todas as sessões do processo."""
+    return CacheFiguras()
+
+
+def hash_dados(df):
+    """Hash do conteúdo do DataFrame (valores, índice, nomes e tipos das colunas)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    h.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    return h.hexdigest()
+
+
+def figura(construtor, dados, **especificacao):
+    """Figura pronta para `construtor(dados, **especificacao)`, do cache ou recém-construída."""
+    with medicao.trecho(f"gráfico: {construtor.__qualname__}"):
+        chave = (
+            f"{construtor.__module__}.{construtor.__qualname__}",
+            hash_dados(dados),
+            json.dumps(especificacao, sort_keys=True, default=str),
+        )
+        return cache_figuras().obter(chave, lambda: construtor(dados, **especificacao))
+
+
+def exibir(construtor, dados, **especificacao):
+    """
+    Desenha a figura do cache. O objeto guardado já foi validado pelo Plotly,
+    então o st.plotly_chart só o serializa, sem reconstruí-lo.
+    """
+    fig = figura(construtor, dados, **especificacao)
+    with medicao.trecho("st.plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def grafico_serie(serie, x, y, faixa, largura, titulo):
+    """
+    Linha de `y` por `x` (crescente) restrita à faixa [início, fim) de x e
+    reduzida por LTTB a `largura` pontos. Faixas com mais de LIMITE_WEBGL
+    pontos usam Scattergl.
+    """
+    serie = serie.dropna(subset=[x, y])
+    valores_x = serie[x].to_numpy()
+    if faixa is not None:
+        limites = np.asarray(faixa, dtype=valores_x.dtype)
+        inicio = np.searchsorted(valores_x, limites[0], side='left')
+        fim = np.searchsorted(valores_x, limites[1], side='left')
+        serie, valores_x = serie.iloc[inicio:fim], valores_x[inicio:fim]
+
+    numericos_x = valores_x.view(np.int64) if valores_x.dtype.kind == 'M' else valores_x
+    escolhidos = lttb(numericos_x, serie[y].to_numpy(dtype=np.float64), largura)
+    traco = go.Scattergl if len(serie) > LIMITE_WEBGL else go.Scatter
+
+    fig = go.Figure(traco(x=valores_x[escolhidos], y=serie[y].to_numpy()[escolhidos],
+                          mode='lines', name=str(y), line=dict(color='#60a5fa', width=1)))
+    fig.update_layout(**TEMA_ESCURO, title=f"{titulo} · {len(escolhidos):,} de {len(serie):,} pontos",
+                      xaxis_title=str(x), yaxis_title=str(y))
+    return fig
+
+
+def exibir_serie(df, x, y, faixa=None, largura=LARGURA_PIXELS, titulo=''):
+    """Desenha a série reduzida da faixa pedida, do cache de figuras quando possível."""
+    exibir(grafico_serie, df[[x, y]], x=x, y=y, faixa=faixa, largura=largura, titulo=titulo)
@@ -0,0 +1,124 @@
+"""
+Medição opcional do tempo de cada rerun, por trecho.
+
+Liga com ?medir=1 na URL ou pelo toggle "⏱️ Medir reruns" da barra
+lateral. Desligada, cada ponto de medição custa só uma consulta ao
+session_state. Ligada, cada rerun guarda o tempo dos blocos do
+apr_sl.py (CSS, barra lateral, página, rodapé), da construção de cada
+gráfico e das transformações marcadas com trecho(); a barra lateral mostra
+o último valor, p50 e p95 dos últimos reruns, e cada rerun pode ser
+acrescentado a um log JSON Lines.
+
+Reruns de fragmentos (st.fragment) não passam pelo apr_sl.py e não são
+medidos.
+"""
+
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import streamlit as st
+
+HISTORICO = 50
+ARQUIVO_LOG = Path(os.environ.get(
+    "MEDICAO_LOG", Path(__file__).resolve().parent.parent / ".cache" / "medicao.jsonl"))
+
+
+def ativa():
+    return (st.query_params.get("medir") in ("1", "true", "sim")
+            or st.session_state.get("medicao_ativa", False))
+
+
+def iniciar():
+    """Abre a medição do rerun (chamado no início do apr_sl.py)."""
+    if ativa():
+        agora = time.perf_counter()
+        st.session_state["_medicao"] = {"inicio": agora, "marca": agora, "trechos": {}}
+    else:
+        st.session_state.pop("_medicao", None)
+
+
+def registrar(nome, segundos):
+    """Soma `segundos` ao trecho `nome` deste rerun (para tempos medidos fora de trecho())."""
+    atual = st.session_state.get("_medicao")
+    if atual is not None:
+        atual["trechos"][nome] = atual["trechos"].get(nome, 0.0) + segundos * 1000
+
+
+def marcar(nome):
+    """Atribui a `nome` o tempo desde a marca anterior (blocos sequenciais do script)."""
+    atual = st.session_state.get("_medicao")
+    if atual is None:
+        return
+    agora = time.perf_counter()
+    registrar(nome, agora - atual["marca"])
+    atual["marca"] = agora
+
+
+@contextmanager
+def trecho(nome):
+    """Mede o bloco `with` como `nome`; repetições no mesmo rerun são somadas."""
+    if st.session_state.get("_medicao") is None:
+        yield
+        return
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar(nome, time.perf_counter() - inicio)
+
+
+def resumo(historico):
+    """Último valor, p50 e p95 (ms) de cada trecho nos reruns do histórico."""
+    # pandas só quando o painel aparece: as páginas só de texto não pagam a importação
+    import pandas as pd
+
+    tempos = pd.DataFrame([r["trechos"] for r in historico]).assign(TOTAL=[r["total"] for r in historico])
+    tabela = pd.DataFrame({
+        "último": tempos.iloc[-1],
+        "p50": tempos.quantile(0.5),
+        "p95": tempos.quantile(0.95),
+        "reruns": tempos.count(),
+    })
+    return tabela.sort_values("p95", ascending=False).round(1)
+
+
+def _gravar(registro):
+    ARQUIVO_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with open(ARQUIVO_LOG, "a", encoding="utf-8") as log:
+        log.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+
+def finalizar(pagina):
+    """Fecha a medição do rerun, guarda no histórico (e no log) e desenha o painel."""
+    atual = st.session_state.pop("_medicao", None)
+    historico = st.session_state.setdefault("_medicao_historico", deque(maxlen=HISTORICO))
+    if atual is not None:
+        registro = {
+            "instante": datetime.now().isoformat(timespec="milliseconds"),
+            "pagina": pagina,
+            "total": (time.perf_counter() - atual["inicio"]) * 1000,
+            "trechos": atual["trechos"],
+        }
+        historico.append(registro)
+        if st.session_state.get("medicao_log"):
+            _gravar(registro)
+
+    with st.sidebar:
+        st.markdown("---")
+        st.toggle("⏱️ Medir reruns", key="medicao_ativa",
+                  help="Também pode ser ligada com ?medir=1 na URL")
+        if not ativa():
+            return
+        st.checkbox("Gravar log JSON Lines", key="medicao_log", help=f"Acrescenta cada rerun a {ARQUIVO_LOG}")
+        if not historico:
+            st.caption("Interaja com a página para medir os próximos reruns.")
+            return
+        tabela = resumo(historico)
+        st.caption(f"Últimos {len(historico)} reruns (ms) · total p50 {tabela.loc['TOTAL', 'p50']:.0f} "
+                   f"· p95 {tabela.loc['TOTAL', 'p95']:.0f}")
+        st.dataframe(tabela, use_container_width=True)
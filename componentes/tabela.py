@@ -0,0 +1,74 @@
+"""
+Visualizador de tabelas grandes com paginação no servidor.
+
+Só a página visível vai para o navegador. Ordenação e filtro rodam no
+servidor sobre índices guardados com st.cache_resource, identificados pela
+versão dos dados (ex.: o hash do arquivo enviado): a mesma ordenação é
+calculada uma vez, e trocar de página só recorta um array de posições.
+"""
+
+import streamlit as st
+
+from nucleo import paginacao
+
+SEM_ORDEM = "(ordem original)"
+SEM_FILTRO = "(sem filtro)"
+
+
+@st.cache_resource(max_entries=8)
+def _ordem(versao, coluna, crescente, _df):
+    return paginacao.ordem(_df, coluna, crescente)
+
+
+@st.cache_resource(max_entries=8)
+def _posicoes(versao, ordenacao, filtro, _df):
+    ordenadas = _ordem(versao, *ordenacao, _df)
+    return paginacao.posicoes(ordenadas, paginacao.mascara(_df, *filtro) if filtro else None)
+
+
+def tabela_paginada(df, versao, chave, linhas_por_pagina=100):
+    """
+    Desenha `df` página a página. `versao` identifica o conteúdo de `df`
+    (tudo o que for calculado fica em cache sob ela) e `chave` prefixa as
+    chaves dos widgets.
+    """
+    colunas = list(df.columns)
+    col1, col2, col3, col4, col5 = st.columns([2, 1, 2, 1, 2])
+    with col1:
+        coluna_ordem = st.selectbox("Ordenar por", [SEM_ORDEM] + colunas, key=f"{chave}_ordem")
+    with col2:
+        sentido = st.radio("Sentido", ["↑", "↓"], horizontal=True, key=f"{chave}_sentido")
+    with col3:
+        coluna_filtro = st.selectbox("Filtrar", [SEM_FILTRO] + colunas, key=f"{chave}_filtro")
+    with col4:
+        operador = st.selectbox("Operador", paginacao.OPERADORES_FILTRO, key=f"{chave}_operador")
+    with col5:
+        texto = st.text_input("Valor", key=f"{chave}_valor")
+
+    ordenacao = (None, True) if coluna_ordem == SEM_ORDEM else (coluna_ordem, sentido == "↑")
+    filtro = None if coluna_filtro == SEM_FILTRO or not texto else (coluna_filtro, operador, texto)
+
+    try:
+        selecionadas = _posicoes(versao, ordenacao, filtro, df)
+    except (ValueError, TypeError) as erro:
+        st.warning(f"Filtro ignorado: {erro}")
+        filtro = None
+        selecionadas = _posicoes(versao, ordenacao, None, df)
+
+    # Ordenação ou filtro novos voltam para a primeira página
+    estado = (versao, ordenacao, filtro)
+    if st.session_state.get(f"{chave}_estado") != estado:
+        st.session_state[f"{chave}_estado"] = estado
+        st.session_state[f"{chave}_pagina"] = 1
+
+    total = len(selecionadas)
+    ultima = paginacao.paginas(total, linhas_por_pagina)
+    st.session_state[f"{chave}_pagina"] = min(st.session_state.get(f"{chave}_pagina", 1), ultima)
+    numero = st.number_input("Página", min_value=1, max_value=ultima, step=1, key=f"{chave}_pagina")
+
+    inicio = (numero - 1) * linhas_por_pagina
+    resumo = f"{total:,} linhas" + (f" (filtradas de {len(df):,})" if filtro else "")
+    if total:
+        resumo += f" · mostrando {inicio + 1:,}–{min(inicio + linhas_por_pagina, total):,} · página {numero} de {ultima}"
+    st.caption(resumo)
+    st.dataframe(paginacao.pagina(df, selecionadas, numero, linhas_por_pagina), use_container_width=True)
@@ -0,0 +1,4 @@
+"""
+Núcleo de dados da apresentação: funções puras de pandas/NumPy, sem
+Streamlit, usadas pelas páginas e pelos benchmarks.
+"""
@@ -0,0 +1,53 @@
+"""
+Cálculo de comissão dos vendedores.
+
+Regra de negócio:
+- Vendedor bateu meta -> 10% de comissão
+- Vendedor superou meta em 20% -> 15% de comissão
+- Vendedor é sênior E bateu meta -> bônus extra de 5%
+- Produto da categoria "Premium" -> comissão dobra
+"""
+
+import numpy as np
+
+
+def calcular_comissao(row):
+    """Versão linha a linha (referência), para uso com DataFrame.apply(axis=1)."""
+    taxa = 0
+    if row['vendas'] >= row['meta'] * 1.2:
+        taxa = 0.15
+    elif row['vendas'] >= row['meta']:
+        taxa = 0.10
+    if row['nivel'] == 'Senior' and row['vendas'] >= row['meta']:
+        taxa += 0.05
+    if row['categoria'] == 'Premium':
+        taxa *= 2
+    return row['vendas'] * taxa
+
+
+def calcular_comissao_vetorizada(vendas, meta, nivel, categoria):
+    """
+    Mesmas regras de calcular_comissao, aplicadas a colunas inteiras.
+
+    Aceita arrays NumPy ou Series e devolve um array float64 com a comissão
+    de cada linha, idêntico ao resultado linha a linha.
+    """
+    vendas = np.asarray(vendas, dtype=np.float64)
+    meta = np.asarray(meta, dtype=np.float64)
+    # Comparação feita antes do asarray: em Series de texto/categoria o pandas
+    # compara sem materializar um array de objetos Python
+    senior = np.asarray(nivel == 'Senior', dtype=bool)
+    premium = np.asarray(categoria == 'Premium', dtype=bool)
+
+    bateu_meta = vendas >= meta
+    superou_20 = vendas >= meta * 1.2
+
+    taxa = np.where(superou_20, 0.15, np.where(bateu_meta, 0.10, 0.0))
+    taxa = taxa + np.where(senior & bateu_meta, 0.05, 0.0)
+    taxa = np.where(premium, taxa * 2, taxa)
+    return vendas * taxa
+
+
+def aplicar_comissao(df):
+    """Atalho para calcular a comissão de um DataFrame com as colunas padrão."""
+    return calcular_comissao_vetorizada(df['vendas'], df['meta'], df['nivel'], df['categoria'])
@@ -0,0 +1,90 @@
+"""
+Cubo de agregados de entrega/satisfação da OLIST.
+
+construir() resume as linhas uma única vez por versão dos dados em células
+(estado_cliente, estado_vendedor, entrega_atrasada, nota, mes) com contagem,
+soma e soma dos quadrados de cada medida. Qualquer combinação de filtros e
+agrupamentos sobre essas dimensões é respondida a partir das células, sem
+voltar às linhas: médias e desvios saem de n, soma e soma².
+"""
+
+import numpy as np
+import pandas as pd
+
+DIMENSOES = ['estado_cliente', 'estado_vendedor', 'entrega_atrasada', 'nota', 'mes']
+MEDIDAS = ['nota', 'dias_entrega', 'valor_pedido', 'frete']
+
+
+def dimensoes(df):
+    """As colunas de dimensão do cubo para cada linha do DataFrame OLIST."""
+    return pd.DataFrame({
+        'estado_cliente': df['estado_cliente'],
+        'estado_vendedor': df['estado_vendedor'],
+        'entrega_atrasada': df['entrega_atrasada'],
+        'nota': df['nota'],
+        'mes': df['data_compra'].dt.to_period('M'),
+    })
+
+
+def construir(df):
+    """Agrega as linhas do DataFrame OLIST nas células do cubo."""
+    linhas = dimensoes(df)
+    agregacoes = {'n': ('nota', 'size')}
+    for medida in MEDIDAS:
+        valores = df[medida].to_numpy(dtype=np.float64)
+        linhas[f'_{medida}'] = valores
+        linhas[f'_{medida}2'] = valores * valores
+        agregacoes[f'soma_{medida}'] = (f'_{medida}', 'sum')
+        agregacoes[f'soma2_{medida}'] = (f'_{medida}2', 'sum')
+
+    cubo = linhas.groupby(DIMENSOES, observed=True, sort=True).agg(**agregacoes).reset_index()
+    cubo['interestadual'] = cubo['estado_cliente'] != cubo['estado_vendedor']
+    cubo['atrasados'] = np.where(cubo['entrega_atrasada'], cubo['n'], 0)
+    return cubo
+
+
+def filtrar(cubo, filtros=None, mascara=None):
+    """
+    Mantém só as células que atendem aos filtros, dados como
+    {dimensão: valores permitidos} (listas vazias ou None não filtram), ou
+    a uma máscara pronta (ex.: de um nucleo.indices.IndiceBitmap do cubo).
+    """
+    if mascara is None:
+        if not filtros:
+            return cubo
+        mascara = np.ones(len(cubo), dtype=bool)
+        for coluna, valores in filtros.items():
+            if valores:
+                mascara &= cubo[coluna].isin(valores).to_numpy()
+    return cubo[mascara]
+
+
+def resumo(cubo, por, filtros=None, mascara=None):
+    """
+    Agrupa as células por `por` e devolve, por grupo: n, a média de cada
+    medida (com o nome da própria medida), o desvio padrão (<medida>_desvio)
+    e a fração de entregas atrasadas (entrega_atrasada).
+    """
+    somas = ['n', 'atrasados'] + [f'soma_{m}' for m in MEDIDAS] + [f'soma2_{m}' for m in MEDIDAS]
+    grupos = filtrar(cubo, filtros, mascara).groupby(por, observed=True)[somas].sum().reset_index()
+
+    n = grupos['n'].to_numpy(dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for medida in MEDIDAS:
+            media = grupos[f'soma_{medida}'] / n
+            variancia = (grupos[f'soma2_{medida}'] / n - media ** 2).clip(lower=0)
+            grupos[medida] = media
+            grupos[f'{medida}_desvio'] = np.sqrt(variancia)
+        if 'entrega_atrasada' not in por:
+            grupos['entrega_atrasada'] = grupos['atrasados'] / n
+    return grupos
+
+
+def totais(cubo, filtros=None, mascara=None):
+    """Resumo de todas as células filtradas como uma única linha (Series)."""
+    celulas = filtrar(cubo, filtros, mascara)
+    n = celulas['n'].sum()
+    linha = {'n': n, 'entrega_atrasada': celulas['atrasados'].sum() / n if n else np.nan}
+    for medida in MEDIDAS:
+        linha[medida] = celulas[f'soma_{medida}'].sum() / n if n else np.nan
+    return pd.Series(linha)
@@ -0,0 +1,63 @@
+"""
+Esquema compacto para os DataFrames da OLIST.
+
+Estados viram categorias (códigos int8 sobre as 27 UFs, iguais para cliente
+e vendedor, então dá para compará-los diretamente), contagens de dias e
+notas viram o menor inteiro que comporta os valores (int8/int16) e as
+colunas derivadas ficam como bool (1 byte). Os nomes e o significado das
+colunas não mudam, então groupby e filtros continuam funcionando igual.
+"""
+
+import pandas as pd
+
+UFS = [
+    'AC', 'AL', 'AM', 'AP', 'BA', 'CE', 'DF', 'ES', 'GO', 'MA', 'MG', 'MS', 'MT', 'PA',
+    'PB', 'PE', 'PI', 'PR', 'RJ', 'RN', 'RO', 'RR', 'RS', 'SC', 'SE', 'SP', 'TO',
+]
+TIPO_UF = pd.CategoricalDtype(UFS)
+
+CATEGORIAS = {'estado_cliente': TIPO_UF, 'estado_vendedor': TIPO_UF}
+INTEIROS = ['dias_entrega', 'prazo_estimado', 'nota']
+BOOLEANOS = ['entrega_atrasada', 'interestadual']
+
+
+def compactar(df):
+    """Converte as colunas conhecidas para os tipos compactos (devolve um novo DataFrame)."""
+    tipos = {}
+    for coluna, tipo in CATEGORIAS.items():
+        if coluna in df.columns:
+            tipos[coluna] = tipo
+    for coluna in BOOLEANOS:
+        if coluna in df.columns:
+            tipos[coluna] = bool
+    compacto = df.astype(tipos)
+
+    for coluna in INTEIROS:
+        if coluna in compacto.columns:
+            compacto[coluna] = pd.to_numeric(compacto[coluna], downcast='integer')
+    return compacto
+
+
+def expandir(df):
+    """Inverso de compactar: strings como objetos Python e inteiros int64, como no DataFrame ingênuo."""
+    tipos = {c: object for c in CATEGORIAS if c in df.columns}
+    tipos.update({c: 'int64' for c in INTEIROS if c in df.columns})
+    return df.astype(tipos)
+
+
+def memoria(df):
+    """Bytes ocupados pelo DataFrame, contando o conteúdo das strings."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def relatorio_memoria(antes, depois):
+    """Memória por coluna antes e depois da compactação."""
+    rel = pd.DataFrame({
+        'tipo_antes': antes.dtypes.astype(str),
+        'bytes_antes': antes.memory_usage(index=False, deep=True),
+        'tipo_depois': depois.dtypes.astype(str),
+        'bytes_depois': depois.memory_usage(index=False, deep=True),
+    })
+    rel.loc['TOTAL'] = ['', memoria(antes), '', memoria(depois)]
+    rel['reducao_%'] = (100 * (1 - rel['bytes_depois'] / rel['bytes_antes'])).round(1)
+    return rel
@@ -0,0 +1,136 @@
+"""
+Testes estatísticos de satisfação (nota) entre entregas atrasadas e no prazo.
+
+A nota só assume os valores 1 a 5, então cada grupo é descrito por um vetor
+de contagens por nota, que sai direto do cubo (nucleo.cubo) sem voltar às
+linhas. Sobre essas contagens:
+
+- Mann-Whitney U com correção de empates e aproximação normal (a mesma de
+  scipy.stats.mannwhitneyu com method="asymptotic"), calculado por postos
+  médios de cada valor;
+- bootstrap da diferença de média e de mediana. Reamostrar n observações
+  de uma variável discreta com reposição equivale a sortear uma multinomial
+  com as proporções observadas, então todas as reamostras de todos os
+  grupos saem de uma única chamada rng.multinomial, sem laços Python.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+NOTAS = np.arange(1, 6)
+
+
+def contagens(cubo, por=None, mascara=None):
+    """
+    Contagens por nota de cada grupo, separadas por atraso.
+
+    Devolve (rotulos, atrasadas, no_prazo), com os dois arrays no formato
+    (grupos, 5). Sem `por`, há um único grupo, "Geral".
+    """
+    celulas = cubo if mascara is None else cubo[mascara]
+    chaves = ([por] if por else []) + ['entrega_atrasada', 'nota']
+    serie = celulas.groupby(chaves, observed=True)['n'].sum()
+    if not por:
+        serie = pd.concat({'Geral': serie}, names=['grupo'])
+    tabela = serie.unstack(['entrega_atrasada', 'nota'], fill_value=0)
+    tabela = tabela.reindex(columns=pd.MultiIndex.from_product([[True, False], NOTAS]), fill_value=0)
+    return tabela.index.astype(str).tolist(), tabela[True].to_numpy(), tabela[False].to_numpy()
+
+
+def mann_whitney(a, b):
+    """
+    Teste U de Mann-Whitney bilateral a partir de contagens (grupos, k).
+    Devolve (U do grupo a, p-valor), um por grupo.
+    """
+    a = np.atleast_2d(a).astype(np.float64)
+    b = np.atleast_2d(b).astype(np.float64)
+    na, nb = a.sum(1), b.sum(1)
+    n = na + nb
+    empates = a + b
+    # Posto médio de cada valor = posições acumuladas até ele menos metade do empate
+    postos = np.cumsum(empates, axis=1) - (empates - 1) / 2
+    u_a = (a * postos).sum(1) - na * (na + 1) / 2
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        media = na * nb / 2
+        correcao = (empates ** 3 - empates).sum(1) / (n * (n - 1))
+        desvio = np.sqrt(na * nb / 12 * ((n + 1) - correcao))
+        u_max = np.maximum(u_a, na * nb - u_a)
+        z = (u_max - media - 0.5) / desvio
+    p = np.array([min(1.0, math.erfc(zi / math.sqrt(2))) if np.isfinite(zi) else np.nan for zi in z])
+    return u_a, p
+
+
+def _medianas(contagens, n, valores):
+    """Mediana de cada distribuição dada por contagens (..., k)."""
+    acumulado = np.cumsum(contagens, axis=-1)
+    baixo = ((n - 1) // 2)[..., None]
+    alto = (n // 2)[..., None]
+    i_baixo = np.minimum((acumulado <= baixo).sum(-1), len(valores) - 1)
+    i_alto = np.minimum((acumulado <= alto).sum(-1), len(valores) - 1)
+    return (valores[i_baixo] + valores[i_alto]) / 2
+
+
+def bootstrap(a, b, reamostras=2000, confianca=0.95, valores=NOTAS, seed=0):
+    """
+    Intervalos de confiança bootstrap (percentil) para a diferença a - b de
+    média e de mediana, por grupo. Todas as reamostras de todos os grupos
+    são sorteadas de uma vez.
+    """
+    a = np.atleast_2d(a).astype(np.int64)
+    b = np.atleast_2d(b).astype(np.int64)
+    valores = np.asarray(valores, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+
+    def sortear(contagens):
+        n = contagens.sum(1)
+        validos = n > 0
+        p = np.where(validos[:, None], contagens / np.maximum(n, 1)[:, None], 1 / len(valores))
+        amostras = rng.multinomial(np.where(validos, n, 0), p, size=(reamostras, len(n)))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            medias = amostras @ valores / n
+        medianas = _medianas(amostras, np.broadcast_to(n, amostras.shape[:-1]), valores)
+        medias[:, ~validos] = np.nan
+        medianas[:, ~validos] = np.nan
+        return medias, medianas
+
+    medias_a, medianas_a = sortear(a)
+    medias_b, medianas_b = sortear(b)
+    cauda = (1 - confianca) / 2 * 100
+    percentis = [cauda, 100 - cauda]
+
+    with np.errstate(invalid='ignore'):
+        ic_media = np.percentile(medias_a - medias_b, percentis, axis=0)
+        ic_mediana = np.percentile(medianas_a - medianas_b, percentis, axis=0)
+    return ic_media, ic_mediana
+
+
+def comparar(rotulos, a, b, reamostras=2000, confianca=0.95, seed=0):
+    """Tabela com médias, medianas, diferenças (atrasou - no prazo), ICs e Mann-Whitney por grupo."""
+    na, nb = a.sum(1), b.sum(1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        media_a = a @ NOTAS / na
+        media_b = b @ NOTAS / nb
+    mediana_a = np.where(na > 0, _medianas(a, na, NOTAS.astype(np.float64)), np.nan)
+    mediana_b = np.where(nb > 0, _medianas(b, nb, NOTAS.astype(np.float64)), np.nan)
+    u, p = mann_whitney(a, b)
+    ic_media, ic_mediana = bootstrap(a, b, reamostras, confianca, seed=seed)
+    return pd.DataFrame({
+        'grupo': rotulos,
+        'n_atrasou': na,
+        'n_no_prazo': nb,
+        'media_atrasou': media_a,
+        'media_no_prazo': media_b,
+        'dif_media': media_a - media_b,
+        'ic_media_inf': ic_media[0],
+        'ic_media_sup': ic_media[1],
+        'mediana_atrasou': mediana_a,
+        'mediana_no_prazo': mediana_b,
+        'dif_mediana': mediana_a - mediana_b,
+        'ic_mediana_inf': ic_mediana[0],
+        'ic_mediana_sup': ic_mediana[1],
+        'u': u,
+        'p_valor': p,
+    })
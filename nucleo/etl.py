@@ -0,0 +1,164 @@
+"""
+ETL incremental: só as linhas novas ou alteradas passam pelas transformações.
+
+Cada linha bruta é identificada pela chave e resumida em um hash do seu
+conteúdo (pd.util.hash_pandas_object) combinado com a `versao` da
+transformação (ex.: um hash das regras de comissão). A tabela tratada é
+gravada junto com esses hashes, num único arquivo Feather que também traz
+a versão nos metadados do esquema; na execução seguinte, as linhas cuja
+chave já existe com o mesmo hash são reaproveitadas da tabela gravada e o
+resto é transformado. Linhas que sumiram do arquivo bruto saem da tabela
+tratada. Se nada mudou, o arquivo não é regravado.
+
+Sessões concorrentes (threads do mesmo processo) podem apontar para o
+mesmo destino: a leitura, a junção e a gravação de um destino acontecem
+sob uma trava dele, a gravação vai para um temporário de nome único e um
+arquivo ilegível conta como "nenhuma tabela gravada". limpar() apaga as
+tabelas que nenhuma execução usa há algum tempo.
+
+Calcular o hash custa da ordem de uma passada por todas as colunas, então o
+ganho aparece quando as transformações são bem mais caras que isso (joins,
+consultas, modelos) e a maior parte das linhas se repete entre execuções.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from nucleo.regras import compilar
+
+COLUNA_HASH = '_hash'
+METADADO_VERSAO = b'etl_versao'
+IDADE_MAXIMA = 24 * 60 * 60  # segundos sem uso até limpar() apagar a tabela
+
+_travas = weakref.WeakValueDictionary()  # destino -> trava, enquanto alguém a usa
+_trava_travas = threading.Lock()
+
+Resumo = namedtuple('Resumo', ['reaproveitadas', 'recalculadas', 'novas', 'removidas'])
+
+
+def tratar_vendas(brutos, regras):
+    """Transformações do ETL de vendas: meta batida e comissão pelas regras compiladas."""
+    tratados = brutos.copy()
+    tratados['bateu_meta'] = tratados['vendas'] >= tratados['meta']
+    tratados['comissao'] = compilar(regras)(tratados)
+    return tratados
+
+
+def hash_linhas(df):
+    """Hash de 64 bits do conteúdo de cada linha (sem o índice)."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _semente(versao):
+    """Inteiro de 64 bits da versão, combinado ao hash de cada linha."""
+    return np.uint64(int(hashlib.sha1(versao.encode()).hexdigest()[:16], 16))
+
+
+def _trava(destino):
+    with _trava_travas:
+        chave = str(Path(destino).resolve())
+        trava = _travas.get(chave)
+        if trava is None:
+            trava = _travas[chave] = threading.Lock()
+        return trava
+
+
+def _ler(destino, versao):
+    # Ausente, truncado ou corrompido: tudo é recalculado e o arquivo, regravado
+    try:
+        tabela = feather.read_table(destino)
+        if (tabela.schema.metadata or {}).get(METADADO_VERSAO) != versao.encode():
+            return None
+        return tabela.to_pandas()
+    except (OSError, pa.ArrowException):
+        return None
+
+
+def _gravar(tratados, hashes, destino, versao):
+    destino = Path(destino)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    tabela = pa.Table.from_pandas(tratados.assign(**{COLUNA_HASH: hashes}), preserve_index=False)
+    # A versão vai no próprio arquivo: tabela e versão trocam juntas
+    tabela = tabela.replace_schema_metadata({**tabela.schema.metadata, METADADO_VERSAO: versao.encode()})
+    # Temporário de nome único (sessões são threads do mesmo processo) + troca atômica
+    descritor, temporario = tempfile.mkstemp(suffix='.tmp', dir=destino.parent)
+    os.close(descritor)
+    try:
+        feather.write_feather(tabela, temporario)
+        os.replace(temporario, destino)
+    except BaseException:
+        os.unlink(temporario)
+        raise
+
+
+def limpar(diretorio, idade=IDADE_MAXIMA):
+    """Apaga as tabelas gravadas em `diretorio` sem uso há mais de `idade` segundos."""
+    limite = time.time() - idade
+    for arquivo in Path(diretorio).glob('*.feather'):
+        try:
+            if arquivo.stat().st_mtime < limite:
+                arquivo.unlink()
+        except FileNotFoundError:  # outra sessão limpou antes
+            pass
+
+
+def atualizar(brutos, chave, transformar, destino, versao=''):
+    """
+    Aplica `transformar` (DataFrame bruto -> DataFrame tratado, mesmas
+    linhas) só às linhas novas ou alteradas de `brutos`, junta com as
+    reaproveitadas da tabela gravada em `destino` e grava o resultado.
+    Devolve (tratados, Resumo), com as linhas na ordem de `brutos`.
+    """
+    if brutos[chave].duplicated().any():
+        raise ValueError(f"chave {chave!r} repetida nos dados brutos")
+    versao = json.dumps([versao, list(map(str, brutos.columns))])
+    hashes = hash_linhas(brutos) ^ _semente(versao)
+    with _trava(destino):
+        return _atualizar(brutos, chave, transformar, destino, versao, hashes)
+
+
+def _atualizar(brutos, chave, transformar, destino, versao, hashes):
+    anterior = _ler(destino, versao)
+    if anterior is None:
+        posicoes = np.full(len(brutos), -1)
+        reaproveitar = np.zeros(len(brutos), dtype=bool)
+        removidas = 0
+    else:
+        posicoes = pd.Index(anterior[chave]).get_indexer(brutos[chave])
+        reaproveitar = posicoes >= 0
+        reaproveitar[reaproveitar] = anterior[COLUNA_HASH].to_numpy()[posicoes[reaproveitar]] == hashes[reaproveitar]
+        removidas = len(anterior) - int((posicoes >= 0).sum())
+
+    partes = []
+    if reaproveitar.any():
+        reaproveitadas = anterior.iloc[posicoes[reaproveitar]].drop(columns=COLUNA_HASH)
+        partes.append(reaproveitadas.set_axis(np.flatnonzero(reaproveitar)))
+    if not partes or not reaproveitar.all():
+        # Sem linhas, transforma o frame vazio: a saída tem sempre as colunas tratadas
+        recalculadas = transformar(brutos[~reaproveitar])
+        partes.append(recalculadas.set_axis(np.flatnonzero(~reaproveitar)))
+    tratados = pd.concat(partes)[partes[-1].columns].sort_index().set_axis(brutos.index)
+
+    recalculadas = int((~reaproveitar).sum())
+    if anterior is None or recalculadas or removidas:
+        _gravar(tratados, hashes, destino, versao)
+    else:
+        os.utime(destino)  # em uso: limpar() não apaga
+    return tratados, Resumo(
+        reaproveitadas=len(brutos) - recalculadas,
+        recalculadas=recalculadas,
+        novas=int((posicoes < 0).sum()),
+        removidas=removidas,
+    )
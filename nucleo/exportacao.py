@@ -0,0 +1,103 @@
+"""
+Exportação de DataFrames em vários formatos, escrita em blocos.
+
+Cada formato grava o DataFrame bloco a bloco (fatias sem cópia) num buffer
+binário, em vez de montar a saída inteira como string (e depois como bytes):
+o pico fica em um bloco convertido mais o arquivo já escrito. O resultado
+são bytes, o que o st.download_button aceita de uma função adiada.
+
+Excel depende de openpyxl ou xlsxwriter; sem nenhum dos dois, o formato
+não aparece em disponiveis().
+"""
+
+import gzip
+import importlib.util
+import io
+from collections import namedtuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+LINHAS_POR_BLOCO = 100_000
+LINHAS_EXCEL = 1_048_575  # limite de uma planilha, fora o cabeçalho
+
+Formato = namedtuple('Formato', ['rotulo', 'extensao', 'mime', 'escrever'])
+
+
+def blocos(df, linhas=LINHAS_POR_BLOCO):
+    for inicio in range(0, len(df), linhas):
+        yield df.iloc[inicio:inicio + linhas]
+
+
+def _escrever_texto_csv(df, binario):
+    texto = io.TextIOWrapper(binario, encoding='utf-8', newline='')
+    for i, bloco in enumerate(blocos(df)):
+        bloco.to_csv(texto, index=False, header=i == 0)
+    if len(df) == 0:
+        df.to_csv(texto, index=False)
+    texto.flush()
+    texto.detach()
+
+
+def escrever_csv(df, destino):
+    _escrever_texto_csv(df, destino)
+
+
+def escrever_csv_gzip(df, destino):
+    with gzip.GzipFile(fileobj=destino, mode='wb', mtime=0) as compactado:
+        _escrever_texto_csv(df, compactado)
+
+
+def escrever_json(df, destino):
+    """Lista JSON de registros, a mesma saída de df.to_json(orient='records', date_format='iso')."""
+    destino.write(b'[')
+    primeiro = True
+    for bloco in blocos(df):
+        registros = bloco.to_json(orient='records', date_format='iso')[1:-1]
+        if registros:
+            destino.write((registros if primeiro else ',' + registros).encode('utf-8'))
+            primeiro = False
+    destino.write(b']')
+
+
+def escrever_parquet(df, destino):
+    """Um row group por bloco, com o esquema do primeiro."""
+    esquema = pa.Schema.from_pandas(df.iloc[:LINHAS_POR_BLOCO], preserve_index=False)
+    with pq.ParquetWriter(destino, esquema) as escritor:
+        for bloco in blocos(df):
+            escritor.write_table(pa.Table.from_pandas(bloco, schema=esquema, preserve_index=False))
+
+
+def escrever_excel(df, destino):
+    if len(df) > LINHAS_EXCEL:
+        raise ValueError(f'O Excel aceita no máximo {LINHAS_EXCEL:,} linhas por planilha; exporte em CSV ou Parquet.')
+    with pd.ExcelWriter(destino) as planilha:
+        for i, bloco in enumerate(blocos(df)):
+            bloco.to_excel(planilha, index=False, header=i == 0,
+                           startrow=0 if i == 0 else i * LINHAS_POR_BLOCO + 1)
+        if len(df) == 0:
+            df.to_excel(planilha, index=False)
+
+
+FORMATOS = {
+    'csv': Formato('CSV', 'csv', 'text/csv', escrever_csv),
+    'csv.gz': Formato('CSV (gzip)', 'csv.gz', 'application/gzip', escrever_csv_gzip),
+    'json': Formato('JSON', 'json', 'application/json', escrever_json),
+    'parquet': Formato('Parquet', 'parquet', 'application/vnd.apache.parquet', escrever_parquet),
+    'xlsx': Formato('Excel', 'xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+                    escrever_excel),
+}
+
+
+def disponiveis():
+    """Formatos cujas dependências estão instaladas."""
+    excel = any(importlib.util.find_spec(m) for m in ('openpyxl', 'xlsxwriter'))
+    return [chave for chave in FORMATOS if chave != 'xlsx' or excel]
+
+
+def exportar(df, formato):
+    """Bytes do arquivo com `df` no formato pedido."""
+    destino = io.BytesIO()
+    FORMATOS[formato].escrever(df, destino)
+    return destino.getvalue()
@@ -0,0 +1,164 @@
+"""
+ETL em lote: um arquivo de vendas por filial, processado em paralelo.
+
+Cada arquivo (CSV ou Excel) é lido, validado (nucleo.validacao) e
+transformado (etl.tratar_vendas) em um processo de um ProcessPoolExecutor; o processo
+principal só junta os resultados.
+
+- Memória: cada processo é trocado por um novo a cada
+  `tarefas_por_processo` arquivos (max_tasks_per_child), o que devolve ao
+  sistema a memória que o pandas deixa fragmentada; o pico por processo
+  fica em torno do maior arquivo já tratado por ele.
+- No máximo `em_voo` arquivos ficam submetidos ao mesmo tempo (padrão: dois
+  por processo), para que nem as entradas nem os resultados se acumulem na
+  fila do executor.
+- Erros: a falha de um arquivo vira uma linha em `erros` sem interromper os
+  outros. Se um processo morrer (ex.: morto pelo sistema por falta de
+  memória), os arquivos em andamento são dados como falhos e o restante
+  segue em um executor novo.
+"""
+
+import io
+import multiprocessing
+import os
+import time
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from nucleo.etl import tratar_vendas
+from nucleo.ingestao import ler_csv
+from nucleo.regras import colunas_usadas
+from nucleo.validacao import validar
+
+TAREFAS_POR_PROCESSO = 50
+EXTENSOES_EXCEL = ('.xlsx', '.xls')
+
+ResultadoLote = namedtuple('ResultadoLote', ['dados', 'erros', 'validacao', 'segundos'])
+
+
+def _nome(origem):
+    return origem[0] if isinstance(origem, tuple) else Path(origem).name
+
+
+def ler_arquivo(origem):
+    """Lê um caminho ou um par (nome, bytes) como CSV ou Excel, pela extensão."""
+    nome = _nome(origem)
+    conteudo = io.BytesIO(origem[1]) if isinstance(origem, tuple) else origem
+    if nome.lower().endswith(EXTENSOES_EXCEL):
+        return pd.read_excel(conteudo)
+    if isinstance(origem, tuple):
+        return ler_csv(conteudo)
+    with open(origem, 'rb') as arquivo:
+        return ler_csv(arquivo)
+
+
+def processar_arquivo(origem, regras, validacoes=None):
+    """
+    Lê, valida e transforma um arquivo (executado nos processos do lote).
+    Devolve os tratados, sem as linhas inválidas, e o relatório de validação.
+    """
+    df = ler_arquivo(origem)
+    faltando = ({'vendas', 'meta'} | colunas_usadas(regras)) - set(df.columns)
+    if faltando:
+        raise ValueError(f"colunas faltando: {', '.join(sorted(faltando))}")
+    for coluna in ('vendas', 'meta'):
+        if not pd.api.types.is_numeric_dtype(df[coluna]):
+            raise ValueError(f"coluna {coluna!r} não é numérica")
+    relatorio = None
+    if validacoes is not None:
+        relatorio, invalidas = validar(df, validacoes)
+        df = df[~invalidas]
+        relatorio.insert(0, 'arquivo', _nome(origem))
+    tratados = tratar_vendas(df, regras)
+    tratados.insert(0, 'arquivo', _nome(origem))
+    return tratados, relatorio
+
+
+def processar_lote(arquivos, regras, validacoes=None, processos=None, em_voo=None,
+                   tarefas_por_processo=TAREFAS_POR_PROCESSO, progresso=None):
+    """
+    Processa `arquivos` (caminhos ou pares (nome, bytes)) em paralelo e
+    devolve ResultadoLote(dados, erros, validacao, segundos): os tratados
+    concatenados na ordem de `arquivos`, um DataFrame (arquivo, erro) com as
+    falhas e, com `validacoes` (conjunto de nucleo.validacao), o relatório
+    de validação de cada arquivo (as linhas inválidas ficam fora de dados).
+    `progresso(concluidos, total, nome)` é chamado a cada arquivo terminado.
+    """
+    inicio = time.perf_counter()
+    arquivos = list(arquivos)
+    processos = max(1, min(processos or os.cpu_count() or 1, len(arquivos)))
+    em_voo = em_voo or 2 * processos
+    # spawn: max_tasks_per_child não é suportado com fork
+    contexto = multiprocessing.get_context('spawn')
+
+    resultados = [None] * len(arquivos)
+    erros = []
+    fila = deque(range(len(arquivos)))
+    concluidos = 0
+
+    def concluir(i, erro=None):
+        nonlocal concluidos
+        if erro is not None:
+            erros.append({'arquivo': _nome(arquivos[i]), 'erro': erro})
+        concluidos += 1
+        if progresso:
+            progresso(concluidos, len(arquivos), _nome(arquivos[i]))
+
+    while fila:
+        with ProcessPoolExecutor(processos, mp_context=contexto,
+                                 max_tasks_per_child=tarefas_por_processo) as executor:
+            em_andamento = {}
+            quebrado = False
+            while (fila or em_andamento) and not quebrado:
+                while fila and len(em_andamento) < em_voo:
+                    i = fila.popleft()
+                    em_andamento[executor.submit(processar_arquivo, arquivos[i], regras, validacoes)] = i
+                prontos, _ = wait(em_andamento, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    i = em_andamento.pop(futuro)
+                    try:
+                        resultados[i] = futuro.result()
+                    except BrokenProcessPool:
+                        quebrado = True
+                        concluir(i, "processo encerrado inesperadamente")
+                        continue
+                    except Exception as erro:
+                        concluir(i, f"{type(erro).__name__}: {erro}")
+                        continue
+                    concluir(i)
+            if quebrado:
+                for i in em_andamento.values():
+                    concluir(i, "processo encerrado inesperadamente")
+
+    validos = [r for r in resultados if r is not None]
+    dados = pd.concat([d for d, _ in validos], ignore_index=True) if validos else pd.DataFrame()
+    relatorios = [r for _, r in validos if r is not None]
+    relatorio = pd.concat(relatorios, ignore_index=True) if relatorios else pd.DataFrame()
+    return ResultadoLote(dados, pd.DataFrame(erros, columns=['arquivo', 'erro']), relatorio,
+                         time.perf_counter() - inicio)
+
+
+def filiais_simuladas(n, linhas=20_000, defeituosas=1, seed=0):
+    """`n` CSVs (nome, bytes) de vendas por filial; os `defeituosas` primeiros sem a coluna meta."""
+    rng = np.random.default_rng(seed)
+    arquivos = []
+    for filial in range(n):
+        meta = rng.integers(1_000, 30_000, linhas)
+        df = pd.DataFrame({
+            'vendedor': [f'F{filial:03d}-{v:05d}' for v in range(linhas)],
+            'vendas': (meta * rng.uniform(0.5, 1.5, linhas)).round(),
+            'meta': meta,
+            'nivel': rng.choice(['Junior', 'Pleno', 'Senior'], linhas),
+            'categoria': rng.choice(['Standard', 'Premium'], linhas),
+        })
+        # Algumas linhas inválidas por filial, para o relatório de validação
+        df.loc[rng.choice(linhas, 3, replace=False), 'nivel'] = 'Estagiário'
+        if filial < defeituosas:
+            df = df.drop(columns='meta')
+        arquivos.append((f'filial_{filial:03d}.csv', df.to_csv(index=False).encode()))
+    return arquivos
@@ -0,0 +1,50 @@
+"""
+Dados do mapa de atrasos por estado.
+
+As agregações saem do cubo (nucleo.cubo), então o navegador recebe uma
+linha por estado (ou por par de estados), nunca as linhas de pedidos.
+
+A geometria vem de assets/brasil_estados.geojson: um polígono
+simplificado por UF (a sigla em properties.sigla), obtido dissolvendo
+por estado a malha municipal 1:2.500.000 do IBGE (2005) e arredondando
+as coordenadas a 0,001°. Fonte dos dados: IBGE, uso livre com citação
+da fonte.
+"""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from nucleo import cubo
+
+ARQUIVO_GEOJSON = Path(__file__).resolve().parent.parent / "assets" / "brasil_estados.geojson"
+PROPRIEDADE_UF = "sigla"
+
+
+def carregar_geojson(caminho=ARQUIVO_GEOJSON):
+    with open(caminho, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def por_estado(celulas, mascara=None):
+    """% de entregas atrasadas, frete médio e pedidos por estado do cliente."""
+    resumo = cubo.resumo(celulas, ["estado_cliente"], mascara=mascara)
+    return pd.DataFrame({
+        "uf": resumo["estado_cliente"].astype(str),
+        "pedidos": resumo["n"],
+        "pct_atraso": (resumo["entrega_atrasada"] * 100).round(1),
+        "frete_medio": resumo["frete"].round(2),
+    })
+
+
+def por_rota(celulas, mascara=None):
+    """Mesmas métricas por par (estado do vendedor → estado do cliente)."""
+    resumo = cubo.resumo(celulas, ["estado_vendedor", "estado_cliente"], mascara=mascara)
+    return pd.DataFrame({
+        "origem": resumo["estado_vendedor"].astype(str),
+        "destino": resumo["estado_cliente"].astype(str),
+        "pedidos": resumo["n"],
+        "pct_atraso": (resumo["entrega_atrasada"] * 100).round(1),
+        "frete_medio": resumo["frete"].round(2),
+    })
@@ -0,0 +1,174 @@
+"""
+Carregamento dos dados OLIST (Brazilian E-Commerce Public Dataset).
+
+Os CSVs originais (pedidos, itens, avaliações, clientes e vendedores) são
+unidos uma única vez e o resultado é gravado em um cache colunar local
+(Feather/Arrow sem compressão). As sessões seguintes leem só as colunas de
+que precisam, via memory-map. O cache é refeito automaticamente quando
+algum CSV de origem muda (tamanho ou data de modificação).
+
+Sem os CSVs, gerar_amostra() produz dados simulados com o mesmo esquema.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from nucleo.esquema import compactar
+
+DIRETORIO_PADRAO = Path(os.environ.get("OLIST_DIR", "data/olist"))
+CACHE_PADRAO = Path(os.environ.get("OLIST_CACHE", ".cache/olist"))
+
+ARQUIVOS = {
+    "pedidos": "olist_orders_dataset.csv",
+    "itens": "olist_order_items_dataset.csv",
+    "avaliacoes": "olist_order_reviews_dataset.csv",
+    "clientes": "olist_customers_dataset.csv",
+    "vendedores": "olist_sellers_dataset.csv",
+}
+
+# Uma linha por item de pedido entregue e avaliado
+COLUNAS = [
+    "pedido_id", "estado_cliente", "estado_vendedor", "data_compra",
+    "dias_entrega", "prazo_estimado", "nota", "valor_pedido", "frete",
+]
+
+# Muda quando o formato do cache muda, para invalidar caches antigos
+VERSAO_CACHE = 2
+
+
+def assinatura(diretorio=DIRETORIO_PADRAO):
+    """
+    Identificador da versão dos CSVs de origem (tamanho + mtime de cada um),
+    ou None se algum arquivo estiver faltando.
+    """
+    partes = [str(VERSAO_CACHE)]
+    for nome in ARQUIVOS.values():
+        caminho = Path(diretorio) / nome
+        try:
+            info = caminho.stat()
+        except FileNotFoundError:
+            return None
+        partes.append(f"{nome}:{info.st_size}:{info.st_mtime_ns}")
+    return hashlib.sha1("|".join(partes).encode()).hexdigest()
+
+
+def disponivel(diretorio=DIRETORIO_PADRAO):
+    return assinatura(diretorio) is not None
+
+
+def unir_csvs(diretorio=DIRETORIO_PADRAO):
+    """Lê os CSVs originais e faz os joins, lendo só as colunas necessárias."""
+    diretorio = Path(diretorio)
+
+    def ler(chave, colunas, **kwargs):
+        return pd.read_csv(diretorio / ARQUIVOS[chave], usecols=colunas, **kwargs)
+
+    datas = ["order_purchase_timestamp", "order_delivered_customer_date", "order_estimated_delivery_date"]
+    pedidos = ler("pedidos", ["order_id", "customer_id", "order_status"] + datas, parse_dates=datas)
+    pedidos = pedidos[(pedidos["order_status"] == "delivered")
+                      & pedidos["order_delivered_customer_date"].notna()]
+
+    itens = ler("itens", ["order_id", "seller_id", "price", "freight_value"])
+    clientes = ler("clientes", ["customer_id", "customer_state"])
+    vendedores = ler("vendedores", ["seller_id", "seller_state"])
+
+    # Alguns pedidos têm mais de uma avaliação: fica a mais recente
+    avaliacoes = ler("avaliacoes", ["order_id", "review_score", "review_answer_timestamp"])
+    avaliacoes = (avaliacoes.sort_values("review_answer_timestamp")
+                  .drop_duplicates("order_id", keep="last")
+                  .drop(columns="review_answer_timestamp"))
+
+    df = (pedidos
+          .merge(clientes, on="customer_id")
+          .merge(itens, on="order_id")
+          .merge(vendedores, on="seller_id")
+          .merge(avaliacoes, on="order_id"))
+
+    compra = df["order_purchase_timestamp"]
+    return pd.DataFrame({
+        "pedido_id": df["order_id"],
+        "estado_cliente": df["customer_state"],
+        "estado_vendedor": df["seller_state"],
+        "data_compra": compra,
+        "dias_entrega": (df["order_delivered_customer_date"] - compra).dt.days,
+        "prazo_estimado": (df["order_estimated_delivery_date"] - compra).dt.days,
+        "nota": df["review_score"],
+        "valor_pedido": df["price"],
+        "frete": df["freight_value"],
+    })
+
+
+def _caminhos_cache(cache):
+    cache = Path(cache)
+    return cache / "olist.feather", cache / "olist.json"
+
+
+def atualizar_cache(diretorio=DIRETORIO_PADRAO, cache=CACHE_PADRAO):
+    """Refaz o cache se os CSVs mudaram. Devolve o caminho do arquivo Feather."""
+    versao = assinatura(diretorio)
+    if versao is None:
+        raise FileNotFoundError(f"CSVs da OLIST não encontrados em {diretorio}")
+
+    arquivo, meta = _caminhos_cache(cache)
+    try:
+        if json.loads(meta.read_text())["assinatura"] == versao and arquivo.exists():
+            return arquivo
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+
+    # Gravado já no esquema compacto: estados como dicionário, inteiros pequenos
+    tabela = pa.Table.from_pandas(compactar(unir_csvs(diretorio)), preserve_index=False)
+    arquivo.parent.mkdir(parents=True, exist_ok=True)
+    # Grava em arquivo temporário e troca atomicamente, para que outra sessão
+    # nunca leia um cache pela metade. Sem compressão, para permitir memory-map.
+    temporario = arquivo.with_suffix(f".{os.getpid()}.tmp")
+    feather.write_feather(tabela, temporario, compression="uncompressed")
+    os.replace(temporario, arquivo)
+    meta.write_text(json.dumps({"assinatura": versao, "linhas": tabela.num_rows}))
+    return arquivo
+
+
+def carregar(colunas=None, diretorio=DIRETORIO_PADRAO, cache=CACHE_PADRAO):
+    """
+    Lê do cache colunar (refazendo-o se preciso) apenas as colunas pedidas,
+    já no esquema compacto de nucleo.esquema.
+    """
+    arquivo = atualizar_cache(diretorio, cache)
+    tabela = feather.read_table(arquivo, columns=colunas, memory_map=True)
+    return compactar(derivar(tabela.to_pandas()))
+
+
+def gerar_amostra(n=100, seed=42):
+    """
+    Dados simulados com as mesmas colunas dos dados reais, nos tipos padrão
+    do pandas (passe por nucleo.esquema.compactar para economizar memória).
+    """
+    rng = np.random.RandomState(seed)
+    df = pd.DataFrame({
+        'pedido_id': range(1, n + 1),
+        'estado_cliente': rng.choice(['SP', 'RJ', 'MG', 'RS', 'PR', 'BA'], n),
+        'estado_vendedor': rng.choice(['SP', 'RJ', 'MG', 'PR'], n),
+        'dias_entrega': rng.randint(3, 25, n),
+        'prazo_estimado': rng.randint(7, 20, n),
+        'nota': rng.choice([1, 2, 3, 4, 5], n, p=[0.05, 0.05, 0.1, 0.3, 0.5]),
+        'valor_pedido': rng.uniform(50, 500, n).round(2),
+        'frete': rng.uniform(10, 80, n).round(2)
+    })
+    df['data_compra'] = pd.Timestamp('2017-01-01') + pd.to_timedelta(rng.randint(0, 730, n), unit='D')
+    return derivar(df)
+
+
+def derivar(df):
+    """Colunas derivadas usadas nas análises."""
+    if {'dias_entrega', 'prazo_estimado'} <= set(df.columns):
+        df['entrega_atrasada'] = df['dias_entrega'] > df['prazo_estimado']
+    if {'estado_cliente', 'estado_vendedor'} <= set(df.columns):
+        df['interestadual'] = df['estado_cliente'] != df['estado_vendedor']
+    return df
@@ -0,0 +1,64 @@
+"""
+Paginação, ordenação e filtro de tabelas grandes no servidor.
+
+A tabela nunca sai inteira do servidor: ordem() devolve as posições das
+linhas já ordenadas (calculadas uma vez por coluna e guardadas pela
+página), mascara() as linhas que passam no filtro e pagina() recorta só
+as linhas visíveis. Trocar de página custa um fatiamento de arrays.
+"""
+
+import numpy as np
+import pandas as pd
+
+from nucleo.regras import OPERADORES
+
+OPERADORES_FILTRO = list(OPERADORES) + ['contém']
+
+
+def ordem(df, coluna=None, crescente=True):
+    """Posições das linhas ordenadas pela coluna (estável, faltantes no fim); sem coluna, a ordem original."""
+    if coluna is None:
+        return np.arange(len(df))
+    serie = df[coluna].reset_index(drop=True)
+    return serie.sort_values(ascending=crescente, kind='stable', na_position='last').index.to_numpy()
+
+
+def converter_valor(serie, texto):
+    """Converte o texto digitado para o tipo da coluna (número, booleano ou data)."""
+    if pd.api.types.is_bool_dtype(serie.dtype):
+        return texto.strip().lower() in ('true', '1', 'sim', 'verdadeiro')
+    if pd.api.types.is_numeric_dtype(serie.dtype):
+        return float(texto.replace(',', '.'))
+    if pd.api.types.is_datetime64_any_dtype(serie.dtype):
+        return pd.Timestamp(texto)
+    return texto
+
+
+def mascara(df, coluna, operador, texto):
+    """
+    Linhas em que `coluna operador texto` vale. "contém" busca o texto (sem
+    diferenciar maiúsculas) na representação textual da coluna. Levanta
+    ValueError se o texto não puder ser convertido para o tipo da coluna.
+    """
+    serie = df[coluna]
+    if operador == 'contém':
+        return serie.astype(str).str.contains(texto, case=False, regex=False, na=False).to_numpy()
+    resultado = OPERADORES[operador](serie, converter_valor(serie, texto))
+    return resultado.fillna(False).to_numpy(dtype=bool)
+
+
+def posicoes(ordenadas, filtro=None):
+    """Posições ordenadas que passam no filtro (máscara bool na ordem original)."""
+    if filtro is None:
+        return ordenadas
+    return ordenadas[filtro[ordenadas]]
+
+
+def paginas(total, tamanho):
+    return max(1, -(-total // tamanho))
+
+
+def pagina(df, selecionadas, numero, tamanho):
+    """As linhas da página `numero` (a partir de 1)."""
+    inicio = (numero - 1) * tamanho
+    return df.iloc[selecionadas[inicio:inicio + tamanho]]
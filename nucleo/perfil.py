@@ -0,0 +1,166 @@
+"""
+Perfil automático das colunas de um DataFrame.
+
+Cada coluna é percorrida uma única vez, de forma vetorizada, produzindo:
+nulos, distintos, mínimo/máximo/média, os k valores mais frequentes e um
+histograma (colunas numéricas).
+
+Os distintos de colunas numéricas, de data e booleanas são estimados com
+HyperLogLog: os bits de cada valor passam por um misturador de 64 bits
+(splitmix64) feito com operações NumPy, e só 2^14 registradores de um byte
+ficam em memória, com erro típico de ~1%. Os mais frequentes só são
+contados exatamente quando a estimativa indica poucos distintos; nas
+demais colunas saem de uma amostra espaçada e são marcados como
+aproximados. Texto e categorias são codificados (pd.factorize / códigos
+da categoria) uma vez, o que já dá distintos e contagens exatos: fazer
+hash de strings com NumPy não sairia mais barato que isso.
+"""
+
+import numpy as np
+import pandas as pd
+
+PRECISAO_HLL = 14
+LIMITE_EXATO = 100_000
+AMOSTRA_TOPO = 1_000_000
+
+
+def _misturar(bits):
+    """splitmix64 sobre um array uint64: espalha os bits para o HyperLogLog."""
+    z = bits + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+class HyperLogLog:
+    """Contador aproximado de distintos sobre hashes de 64 bits."""
+
+    def __init__(self, precisao=PRECISAO_HLL):
+        self.precisao = precisao
+        self.registros = np.zeros(1 << precisao, dtype=np.uint8)
+
+    def adicionar(self, hashes):
+        p = self.precisao
+        indices = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        resto = hashes << np.uint64(p)
+        # Posição do primeiro bit 1 do resto: 64 - expoente do float (frexp).
+        # O arredondamento para float só erra quando o resto fica a 2^-53 de
+        # uma potência de dois, o que não muda a estimativa.
+        _, expoentes = np.frexp(resto.astype(np.float64))
+        posicoes = np.clip(65 - expoentes, 1, 64 - p + 1).astype(np.uint8)
+        np.maximum.at(self.registros, indices, posicoes)
+        return self
+
+    def unir(self, outro):
+        np.maximum(self.registros, outro.registros, out=self.registros)
+        return self
+
+    def estimativa(self):
+        m = len(self.registros)
+        alfa = 0.7213 / (1 + 1.079 / m)
+        bruta = alfa * m * m / np.sum(np.ldexp(1.0, -self.registros.astype(np.int64)))
+        vazios = int(np.count_nonzero(self.registros == 0))
+        if bruta <= 2.5 * m and vazios:
+            return m * np.log(m / vazios)  # contagem linear, melhor para poucos distintos
+        return bruta
+
+
+def _bits(valores):
+    """Bits de cada valor como uint64 (com -0.0 igualado a 0.0)."""
+    if valores.dtype.kind == 'f':
+        return (valores.astype(np.float64) + 0.0).view(np.uint64)
+    return valores.astype(np.int64).view(np.uint64)
+
+
+def _topo(codigos, rotulos, k, escala=1, minimo=1):
+    contagens = np.bincount(codigos[codigos >= 0], minlength=len(rotulos))
+    if len(contagens) > k:
+        maiores = np.argpartition(contagens, -k)[-k:]
+    else:
+        maiores = np.arange(len(contagens))
+    maiores = maiores[np.argsort(-contagens[maiores], kind='stable')]
+    return [(rotulos[i], int(contagens[i]) * escala) for i in maiores if contagens[i] >= minimo]
+
+
+def perfil_coluna(serie, k=5, faixas=20):
+    """Dicionário com o perfil de uma coluna."""
+    nulos = int(serie.isna().sum())
+    validos = serie.dropna()
+    perfil = {
+        'coluna': serie.name, 'tipo': str(serie.dtype), 'linhas': len(serie), 'nulos': nulos,
+        'distintos': 0, 'distintos_exato': True, 'minimo': None, 'maximo': None, 'media': None,
+        'topo': [], 'topo_exato': True, 'histograma': None,
+    }
+    if validos.empty:
+        return perfil
+
+    tipo = serie.dtype
+    numerica = pd.api.types.is_numeric_dtype(tipo) and not isinstance(tipo, pd.CategoricalDtype)
+    data = pd.api.types.is_datetime64_any_dtype(tipo)
+
+    if isinstance(tipo, pd.CategoricalDtype) or not (numerica or data):
+        if isinstance(tipo, pd.CategoricalDtype):
+            codigos, rotulos = validos.cat.codes.to_numpy(), validos.cat.categories
+        else:
+            codigos, rotulos = pd.factorize(validos)
+        perfil['distintos'] = int(np.count_nonzero(np.bincount(codigos, minlength=len(rotulos))))
+        perfil['topo'] = _topo(codigos, rotulos, k)
+        return perfil
+
+    if data:
+        perfil.update(minimo=validos.min(), maximo=validos.max(), media=validos.mean())
+        valores = validos.astype('int64').to_numpy()
+    else:
+        booleana = pd.api.types.is_bool_dtype(tipo)
+        valores = validos.to_numpy(dtype=np.uint8 if booleana else (np.float64 if tipo.kind == 'f' else np.int64))
+        perfil.update(minimo=valores.min().item(), maximo=valores.max().item(), media=float(valores.mean()))
+        if booleana:
+            perfil.update(minimo=bool(perfil['minimo']), maximo=bool(perfil['maximo']))
+        else:
+            finitos = valores[np.isfinite(valores)] if valores.dtype.kind == 'f' else valores
+            if len(finitos):
+                perfil['histograma'] = np.histogram(finitos, bins=faixas)
+
+    estimativa = HyperLogLog().adicionar(_misturar(_bits(valores))).estimativa()
+    perfil.update(distintos=int(round(estimativa)), distintos_exato=False)
+
+    if estimativa <= LIMITE_EXATO:
+        codigos, rotulos = pd.factorize(validos)
+        perfil['distintos'], perfil['distintos_exato'] = len(rotulos), True
+        perfil['topo'] = _topo(codigos, rotulos, k)
+    else:
+        # Na amostra, um valor visto uma vez só não diz nada sobre a frequência
+        passo = -(-len(validos) // AMOSTRA_TOPO)
+        codigos, rotulos = pd.factorize(validos.iloc[::passo])
+        perfil['topo'], perfil['topo_exato'] = _topo(codigos, rotulos, k, passo, minimo=2), False
+    return perfil
+
+
+def perfilar(df, k=5, faixas=20):
+    """Perfil de todas as colunas, na ordem do DataFrame."""
+    return [perfil_coluna(df[coluna], k, faixas) for coluna in df.columns]
+
+
+def tabela(perfis):
+    """Resumo dos perfis, uma linha por coluna, pronto para exibir."""
+    def formatar(valor):
+        if valor is None:
+            return ''
+        if isinstance(valor, float):
+            return f'{valor:,.6g}'
+        return str(valor)
+
+    return pd.DataFrame({
+        'coluna': [str(p['coluna']) for p in perfis],
+        'tipo': [p['tipo'] for p in perfis],
+        'nulos': [p['nulos'] for p in perfis],
+        '% nulos': [round(100 * p['nulos'] / p['linhas'], 2) if p['linhas'] else 0.0 for p in perfis],
+        'distintos': [f"{'' if p['distintos_exato'] else '~'}{p['distintos']:,}" for p in perfis],
+        'mínimo': [formatar(p['minimo']) for p in perfis],
+        'máximo': [formatar(p['maximo']) for p in perfis],
+        'média': [formatar(p['media']) for p in perfis],
+        'mais frequentes': [
+            ('' if p['topo_exato'] or not p['topo'] else '~ ') + ', '.join(f'{v} ({c:,})' for v, c in p['topo'])
+            for p in perfis
+        ],
+    })
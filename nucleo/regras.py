@@ -0,0 +1,229 @@
+"""
+Motor de regras de comissão declarativo.
+
+As regras são dados (JSON), não código. Exemplo de conjunto:
+
+    {
+      "base": "vendas",
+      "regras": [
+        {"nome": "Bateu meta → 10%",
+         "se": [["vendas", ">=", {"coluna": "meta"}]],
+         "acao": "definir", "valor": 0.10},
+        {"nome": "Premium dobra",
+         "se": [["categoria", "==", "Premium"]],
+         "acao": "multiplicar", "valor": 2}
+      ]
+    }
+
+A taxa começa em 0 e as regras são aplicadas em ordem, cada uma só nas
+linhas em que todas as suas condições valem (E lógico). Ações: "definir"
+(taxa = valor), "somar" (taxa += valor) e "multiplicar" (taxa *= valor).
+O resultado é base * taxa.
+
+Uma condição é [coluna, operador, valor], em que valor pode ser um literal,
+uma lista (para "em"/"fora") ou {"coluna": nome, "fator": f} para comparar
+com outra coluna multiplicada por f.
+
+compilar() transforma o conjunto em um Avaliador que opera em colunas
+inteiras com NumPy. A compilação é feita uma vez por conjunto de regras e
+reaproveitada por todo o processo (todas as sessões e reruns).
+"""
+
+import functools
+import json
+import operator
+
+import numpy as np
+
+OPERADORES = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+}
+OPERADORES_CONJUNTO = ('em', 'fora')
+ACOES = ('definir', 'somar', 'multiplicar')
+
+
+class RegraInvalida(ValueError):
+    """Conjunto de regras mal formado."""
+
+
+def _numero(valor):
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+
+def carregar_regras(caminho):
+    with open(caminho, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _chave(conjunto):
+    """Forma canônica (texto JSON) usada como chave do cache de compilação."""
+    return json.dumps(conjunto, sort_keys=True, ensure_ascii=False)
+
+
+def compilar(conjunto):
+    """Compila (ou reaproveita do cache) o avaliador do conjunto de regras."""
+    return _compilar(_chave(conjunto))
+
+
+@functools.lru_cache(maxsize=32)
+def _compilar(chave):
+    conjunto = json.loads(chave)
+    if not isinstance(conjunto, dict) or not isinstance(conjunto.get('regras'), list):
+        raise RegraInvalida('O conjunto precisa de uma lista "regras".')
+    if not all(isinstance(regra, dict) for regra in conjunto['regras']):
+        raise RegraInvalida('Cada regra deve ser um objeto JSON.')
+
+    base = conjunto.get('base', 'vendas')
+    if not isinstance(base, str):
+        raise RegraInvalida(f'"base" deve ser o nome de uma coluna, não {base!r}.')
+    passos = [_compilar_regra(i, regra) for i, regra in enumerate(conjunto['regras'], start=1)]
+    return Avaliador(base, passos, conjunto)
+
+
+def colunas_usadas(conjunto):
+    """Colunas que o conjunto de regras lê do DataFrame."""
+    colunas = {conjunto.get('base', 'vendas')}
+    for regra in conjunto['regras']:
+        for coluna, _, valor in regra.get('se', []):
+            colunas.add(coluna)
+            if isinstance(valor, dict):
+                colunas.add(valor['coluna'])
+    return colunas
+
+
+def _compilar_regra(posicao, regra):
+    nome = regra.get('nome', f'Regra {posicao}')
+    acao = regra.get('acao')
+    if acao not in ACOES:
+        raise RegraInvalida(f'{nome}: ação "{acao}" inválida (use {", ".join(ACOES)}).')
+    if not _numero(regra.get('valor')):
+        raise RegraInvalida(f'{nome}: "valor" precisa ser numérico.')
+    valor = float(regra['valor'])
+    if not isinstance(regra.get('se', []), list):
+        raise RegraInvalida(f'{nome}: "se" espera uma lista de condições.')
+
+    condicoes = [compilar_condicao(nome, c) for c in regra.get('se', [])]
+    return nome, condicoes, acao, valor
+
+
+def compilar_condicao(nome, condicao):
+    """
+    (chave, avaliar) da condição [coluna, operador, valor]: avaliar(df) dá a
+    máscara booleana das linhas em que ela vale. `nome` só entra nas
+    mensagens de erro. Também usada por nucleo.validacao.
+    """
+    try:
+        coluna, op, valor = condicao
+    except (TypeError, ValueError):
+        raise RegraInvalida(f'{nome}: condição {condicao!r} deve ser [coluna, operador, valor].') from None
+    if not isinstance(coluna, str) or not isinstance(op, str):
+        raise RegraInvalida(f'{nome}: em {condicao!r}, coluna e operador devem ser textos.')
+
+    if op in OPERADORES_CONJUNTO:
+        if not isinstance(valor, list):
+            raise RegraInvalida(f'{nome}: operador "{op}" espera uma lista de valores.')
+        valores = list(valor)
+        negar = op == 'fora'
+
+        def avaliar(colunas):
+            mascara = np.asarray(colunas[coluna].isin(valores), dtype=bool)
+            return ~mascara if negar else mascara
+    elif op in OPERADORES:
+        comparar = OPERADORES[op]
+        if isinstance(valor, dict):
+            if not isinstance(valor.get('coluna'), str):
+                raise RegraInvalida(f'{nome}: referência {valor!r} precisa de "coluna" (texto).')
+            if not _numero(valor.get('fator', 1)):
+                raise RegraInvalida(f'{nome}: em {valor!r}, "fator" precisa ser numérico.')
+            outra = valor['coluna']
+            fator = float(valor.get('fator', 1))
+
+            def avaliar(colunas):
+                direita = colunas[outra].to_numpy(dtype=np.float64)
+                if fator != 1:
+                    direita = direita * fator
+                return comparar(colunas[coluna].to_numpy(dtype=np.float64), direita)
+        else:
+            def avaliar(colunas):
+                return np.asarray(comparar(colunas[coluna], valor), dtype=bool)
+    else:
+        raise RegraInvalida(f'{nome}: operador "{op}" desconhecido.')
+
+    # A chave permite reaproveitar a mesma máscara entre regras numa avaliação
+    return json.dumps(condicao, sort_keys=True, ensure_ascii=False), avaliar
+
+
+class Avaliador:
+    """Conjunto de regras compilado; chame com um DataFrame."""
+
+    def __init__(self, base, passos, conjunto):
+        self.base = base
+        self.passos = passos
+        self.conjunto = conjunto
+
+    def taxa(self, df):
+        taxa = np.zeros(len(df), dtype=np.float64)
+        mascaras = {}
+        for _, condicoes, acao, valor in self.passos:
+            ativa = None
+            for chave, avaliar in condicoes:
+                if chave not in mascaras:
+                    mascaras[chave] = avaliar(df)
+                ativa = mascaras[chave] if ativa is None else ativa & mascaras[chave]
+
+            if acao == 'definir':
+                novo = np.full_like(taxa, valor)
+            elif acao == 'somar':
+                novo = taxa + valor
+            else:
+                novo = taxa * valor
+            taxa = novo if ativa is None else np.where(ativa, novo, taxa)
+        return taxa
+
+    def __call__(self, df):
+        return df[self.base].to_numpy(dtype=np.float64) * self.taxa(df)
+
+
+def descrever(conjunto):
+    """Lista em Markdown com o nome de cada regra, para exibir na página."""
+    return '\n'.join(f"- {regra.get('nome', f'Regra {i}')}"
+                     for i, regra in enumerate(conjunto['regras'], start=1))
+
+
+def como_python(conjunto):
+    """Código Python linha a linha equivalente ao conjunto, para fins didáticos."""
+    simbolos = {'definir': '=', 'somar': '+=', 'multiplicar': '*='}
+    linhas = ['def calcular_comissao(row):', '    taxa = 0', '']
+    for i, regra in enumerate(conjunto['regras'], start=1):
+        testes = [_condicao_python(c) for c in regra.get('se', [])]
+        linhas.append(f"    # {regra.get('nome', f'Regra {i}')}")
+        recuo = '    '
+        if testes:
+            linhas.append(f"    if {' and '.join(testes)}:")
+            recuo = '        '
+        linhas.append(f"{recuo}taxa {simbolos[regra['acao']]} {regra['valor']}")
+        linhas.append('')
+    base = conjunto.get('base', 'vendas')
+    linhas += [f"    return row['{base}'] * taxa", '',
+               "df['comissao'] = df.apply(calcular_comissao, axis=1)"]
+    return '\n'.join(linhas)
+
+
+def _condicao_python(condicao):
+    coluna, op, valor = condicao
+    if isinstance(valor, dict):
+        direita = f"row['{valor['coluna']}']"
+        if valor.get('fator', 1) != 1:
+            direita += f" * {valor['fator']}"
+    else:
+        direita = repr(valor)
+    if op == 'em':
+        return f"row['{coluna}'] in {direita}"
+    if op == 'fora':
+        return f"row['{coluna}'] not in {direita}"
+    return f"row['{coluna}'] {op} {direita}"
@@ -0,0 +1,255 @@
+"""
+Fonte SQL para os dashboards: pool de conexões e consultas em cache.
+
+PoolConexoes guarda até `tamanho` conexões DB-API abertas e as empresta a
+uma thread por vez, então sessões e reruns não abrem conexões novas.
+FonteSQL monta as consultas com a projeção (só as colunas pedidas) e os
+filtros no próprio SQL, sempre com parâmetros (nunca valores no texto da
+consulta), e guarda cada resultado por `ttl` segundos. O cache é indexado
+pela consulta e pelos parâmetros e marcado com as tabelas lidas, para que
+uma carga em uma tabela invalide só as consultas que dependem dela (ou
+uma consulta só, pela chave). Uma invalidação que chega durante uma ida
+ao banco impede que o resultado dela, já velho, entre no cache.
+
+Os filtros usam a sintaxe de condição de nucleo.regras:
+
+    [["estado_cliente", "em", ["SP", "RJ"]],
+     ["data_compra", ">=", "2017-01-01"],
+     ["frete", "<", {"coluna": "valor_pedido", "fator": 0.5}]]
+
+Nomes de tabela e coluna são conferidos com o esquema da tabela antes de
+entrar no SQL. Funciona com qualquer driver DB-API (sqlite3, psycopg...);
+`marcador` é o placeholder de parâmetro do driver ("?" ou "%s").
+"""
+
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from nucleo.regras import OPERADORES, OPERADORES_CONJUNTO, RegraInvalida
+
+TTL_PADRAO = 300
+MAX_ENTRADAS = 128
+OPERADORES_SQL = {'==': '=', '!=': '<>', '>': '>', '>=': '>=', '<': '<', '<=': '<='}
+
+
+class PoolConexoes:
+    """Até `tamanho` conexões criadas por `fabrica()`, emprestadas uma thread por vez."""
+
+    def __init__(self, fabrica, tamanho=4, espera=30):
+        self.fabrica = fabrica
+        self.espera = espera
+        self.livres = queue.LifoQueue()
+        self.vagas = threading.BoundedSemaphore(tamanho)
+        self.fechado = False
+
+    @contextmanager
+    def conexao(self):
+        if not self.vagas.acquire(timeout=self.espera):
+            raise TimeoutError(f"nenhuma conexão livre em {self.espera} s")
+        try:
+            try:
+                conexao = self.livres.get_nowait()
+            except queue.Empty:
+                conexao = self.fabrica()
+            try:
+                yield conexao
+            except BaseException:
+                # Estado desconhecido (transação aberta, conexão caída): descarta
+                conexao.close()
+                raise
+            if self.fechado:
+                conexao.close()
+            else:
+                self.livres.put(conexao)
+        finally:
+            self.vagas.release()
+
+    def fechar(self):
+        """Fecha as conexões livres; as emprestadas são fechadas na devolução."""
+        self.fechado = True
+        while True:
+            try:
+                self.livres.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _valor(valor):
+    """Escalares NumPy viram tipos Python, que todo driver DB-API aceita."""
+    return valor.item() if isinstance(valor, np.generic) else valor
+
+
+def _identificador(nome):
+    return '"' + nome.replace('"', '""') + '"'
+
+
+class FonteSQL:
+    """Consultas com projeção e filtros no SQL, em cache por `ttl` segundos."""
+
+    def __init__(self, pool, ttl=TTL_PADRAO, max_entradas=MAX_ENTRADAS, marcador='?'):
+        self.pool = pool
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self.marcador = marcador
+        self._cache = OrderedDict()  # (consulta, parâmetros) -> (expira, tabelas, DataFrame)
+        self._esquemas = {}
+        self._carregando = {}  # (consulta, parâmetros) -> trava da ida ao banco em andamento
+        self._descartar = set()  # travas das idas ao banco cuja consulta foi invalidada no meio
+        self._geracao = 0  # sobe a cada invalidação total
+        self._geracoes = {}  # tabela -> sobe a cada invalidação da tabela
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+
+    def colunas(self, tabela):
+        """Colunas da tabela, lidas uma vez do banco."""
+        if tabela not in self._esquemas:
+            with self.pool.conexao() as conexao:
+                cursor = conexao.cursor()
+                cursor.execute(f"SELECT * FROM {_identificador(tabela)} WHERE 1 = 0")
+                self._esquemas[tabela] = [d[0] for d in cursor.description]
+                cursor.close()
+        return self._esquemas[tabela]
+
+    def _conferir(self, tabela, colunas):
+        desconhecidas = set(colunas) - set(self.colunas(tabela))
+        if desconhecidas:
+            raise ValueError(f"colunas inexistentes em {tabela}: {', '.join(sorted(desconhecidas))}")
+
+    def _condicao(self, condicao):
+        try:
+            coluna, op, valor = condicao
+        except (TypeError, ValueError):
+            raise RegraInvalida(f'Filtro {condicao!r} deve ser [coluna, operador, valor].') from None
+        if op in OPERADORES_CONJUNTO:
+            if not isinstance(valor, list):
+                raise RegraInvalida(f'Filtro {condicao!r}: operador "{op}" espera uma lista de valores.')
+            if not valor:
+                return ('1 = 0' if op == 'em' else '1 = 1'), [], [coluna]
+            negacao = 'NOT ' if op == 'fora' else ''
+            marcadores = ', '.join([self.marcador] * len(valor))
+            return f"{_identificador(coluna)} {negacao}IN ({marcadores})", [_valor(v) for v in valor], [coluna]
+        if op not in OPERADORES:
+            raise RegraInvalida(f'Filtro {condicao!r}: operador "{op}" desconhecido.')
+        if isinstance(valor, dict):
+            outra, fator = valor['coluna'], valor.get('fator', 1)
+            texto = f"{_identificador(coluna)} {OPERADORES_SQL[op]} {_identificador(outra)} * {self.marcador}"
+            return texto, [_valor(fator)], [coluna, outra]
+        return f"{_identificador(coluna)} {OPERADORES_SQL[op]} {self.marcador}", [_valor(valor)], [coluna]
+
+    def montar(self, tabela, colunas=None, filtros=(), ordem=None, limite=None):
+        """(consulta, parâmetros) do SELECT com projeção, filtros, ordem e limite."""
+        usadas = list(colunas or []) + list(ordem or [])
+        partes, parametros = [], []
+        for condicao in filtros:
+            texto, valores, referidas = self._condicao(condicao)
+            partes.append(texto)
+            parametros += valores
+            usadas += referidas
+        self._conferir(tabela, usadas)
+
+        projecao = ', '.join(map(_identificador, colunas)) if colunas else '*'
+        consulta = f"SELECT {projecao} FROM {_identificador(tabela)}"
+        if partes:
+            consulta += ' WHERE ' + ' AND '.join(partes)
+        if ordem:
+            consulta += ' ORDER BY ' + ', '.join(map(_identificador, ordem))
+        if limite is not None:
+            consulta += f" LIMIT {int(limite)}"
+        return consulta, tuple(parametros)
+
+    def consultar(self, tabela, colunas=None, filtros=(), ordem=None, limite=None):
+        """DataFrame das `colunas` de `tabela` que passam nos `filtros` (do cache, se ainda válido)."""
+        consulta, parametros = self.montar(tabela, colunas, filtros, ordem, limite)
+        return self.sql(consulta, parametros, tabelas=[tabela])
+
+    def _marca(self, tabelas):
+        return self._geracao, tuple(self._geracoes.get(t, 0) for t in tabelas)
+
+    def _do_cache(self, chave):
+        entrada = self._cache.get(chave)
+        if entrada is None or entrada[0] <= time.monotonic():
+            return None
+        self._cache.move_to_end(chave)
+        return entrada[2]
+
+    def sql(self, consulta, parametros=(), tabelas=()):
+        """
+        Consulta SQL parametrizada em cache; `tabelas` são as que ela lê, para
+        invalidar. Sessões que pedem a mesma consulta ao mesmo tempo esperam
+        uma única ida ao banco.
+        """
+        chave = (consulta, tuple(parametros))
+        with self._trava:
+            df = self._do_cache(chave)
+            if df is not None:
+                self.acertos += 1
+                return df.copy(deep=False)
+            carregando = self._carregando.setdefault(chave, threading.Lock())
+
+        try:
+            with carregando:
+                with self._trava:
+                    df = self._do_cache(chave)
+                    if df is not None:
+                        self.acertos += 1
+                        return df.copy(deep=False)
+                    marca = self._marca(tabelas)
+
+                with self.pool.conexao() as conexao:
+                    cursor = conexao.cursor()
+                    cursor.execute(consulta, parametros)
+                    nomes = [d[0] for d in cursor.description]
+                    df = pd.DataFrame.from_records(cursor.fetchall(), columns=nomes)
+                    cursor.close()
+
+                with self._trava:
+                    self.faltas += 1
+                    # Invalidada durante a ida ao banco: o resultado serve a quem pediu, mas não ao cache
+                    if carregando in self._descartar or self._marca(tabelas) != marca:
+                        return df.copy(deep=False)
+                    self._cache[chave] = (time.monotonic() + self.ttl, frozenset(tabelas), df)
+                    self._cache.move_to_end(chave)
+                    while len(self._cache) > self.max_entradas:
+                        self._cache.popitem(last=False)
+        finally:
+            with self._trava:
+                if self._carregando.get(chave) is carregando:
+                    del self._carregando[chave]
+                self._descartar.discard(carregando)
+        return df.copy(deep=False)
+
+    def invalidar(self, tabela=None):
+        """Descarta do cache as consultas que leem `tabela` (ou todas). Devolve quantas."""
+        with self._trava:
+            if tabela is None:
+                self._geracao += 1
+                removidas = len(self._cache)
+                self._cache.clear()
+                self._esquemas.clear()
+                return removidas
+            self._geracoes[tabela] = self._geracoes.get(tabela, 0) + 1
+            chaves = [c for c, (_, tabelas, _) in self._cache.items() if tabela in tabelas]
+            for chave in chaves:
+                del self._cache[chave]
+            self._esquemas.pop(tabela, None)
+            return len(chaves)
+
+    def invalidar_consulta(self, consulta, parametros=()):
+        """Descarta do cache uma consulta (a chave de sql()/montar()). Devolve quantas (0 ou 1)."""
+        chave = (consulta, tuple(parametros))
+        with self._trava:
+            if chave in self._carregando:
+                self._descartar.add(self._carregando[chave])
+            return int(self._cache.pop(chave, None) is not None)
+
+    def fechar(self):
+        """Esvazia o cache e fecha as conexões do pool."""
+        self.invalidar()
+        self.pool.fechar()
@@ -0,0 +1,49 @@
+"""
+Séries em tempo real: buffer circular de tamanho fixo e um feed simulado.
+
+O BufferCircular guarda só os últimos `capacidade` pontos em um array
+NumPy alocado uma vez; pontos novos sobrescrevem os mais antigos, então a
+memória e o custo de desenhar o gráfico não crescem com o tempo de
+execução.
+"""
+
+import numpy as np
+
+
+class BufferCircular:
+    """Últimos `capacidade` pontos, cada um com `largura` valores."""
+
+    def __init__(self, capacidade, largura=1, dtype=np.float64):
+        self.capacidade = capacidade
+        self.valores = np.empty((capacidade, largura), dtype=dtype)
+        self.posicao = 0  # onde entra o próximo ponto
+        self.tamanho = 0
+        self.total = 0  # pontos recebidos desde o início
+
+    def __len__(self):
+        return self.tamanho
+
+    def adicionar(self, pontos):
+        """Acrescenta pontos (array (k, largura) ou (k,)), descartando os mais antigos."""
+        pontos = np.asarray(pontos, dtype=self.valores.dtype).reshape(-1, self.valores.shape[1])
+        self.total += len(pontos)
+        pontos = pontos[-self.capacidade:]
+        indices = (self.posicao + np.arange(len(pontos))) % self.capacidade
+        self.valores[indices] = pontos
+        self.posicao = (self.posicao + len(pontos)) % self.capacidade
+        self.tamanho = min(self.tamanho + len(pontos), self.capacidade)
+
+    def dados(self):
+        """Cópia dos pontos guardados, do mais antigo para o mais recente."""
+        if self.tamanho < self.capacidade:
+            return self.valores[:self.tamanho].copy()
+        return np.concatenate((self.valores[self.posicao:], self.valores[:self.posicao]))
+
+    def ultimo(self):
+        return self.valores[(self.posicao - 1) % self.capacidade] if self.tamanho else None
+
+
+def passeio_vendas(rng, ultimo, n, volatilidade=0.03, minimo=10.0):
+    """`n` próximos valores de vendas: passeio aleatório multiplicativo a partir de `ultimo`."""
+    passos = rng.normal(0.0, volatilidade, n)
+    return np.maximum(ultimo * np.exp(np.cumsum(passos)), minimo)
@@ -0,0 +1,126 @@
+"""
+Validação declarativa de DataFrames, avaliada coluna a coluna.
+
+Como as regras de comissão, as validações são dados (JSON). Cada regra tem
+um "nome" e um dos tipos:
+
+    {"nome": "...", "preenchidas": ["vendas", "meta"]}       # sem nulos
+    {"nome": "...", "unicas": ["vendedor"]}                  # sem repetição
+    {"nome": "...", "exige": [["vendas", ">=", 0],           # condições de
+                              ["meta", ">", 0]]}             # nucleo.regras
+
+As condições de "exige" usam a mesma sintaxe e o mesmo compilador das
+regras de comissão (faixas, listas com "em"/"fora" e comparação com outra
+coluna via {"coluna": nome, "fator": f}); uma linha viola a regra se alguma
+condição não vale. Como num CHECK do SQL, valores nulos não violam "exige":
+quem cobra preenchimento é "preenchidas".
+
+Cada regra vira uma máscara booleana sobre a coluna inteira; o relatório
+traz, por regra, quantas linhas a violam e alguns índices de exemplo.
+"""
+
+import functools
+import json
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from nucleo.regras import RegraInvalida, carregar_regras, compilar_condicao
+
+EXEMPLOS = 5
+TIPOS = ('preenchidas', 'unicas', 'exige')
+
+Validacao = namedtuple('Validacao', ['relatorio', 'invalidas'])
+
+
+def carregar_validacao(caminho):
+    return carregar_regras(caminho)
+
+
+def compilar(conjunto):
+    """Compila (ou reaproveita do cache) o validador do conjunto."""
+    return _compilar(json.dumps(conjunto, sort_keys=True, ensure_ascii=False))
+
+
+@functools.lru_cache(maxsize=32)
+def _compilar(chave):
+    conjunto = json.loads(chave)
+    if not isinstance(conjunto, dict) or not isinstance(conjunto.get('regras'), list):
+        raise RegraInvalida('O conjunto precisa de uma lista "regras".')
+    return Validador([_compilar_regra(i, regra) for i, regra in enumerate(conjunto['regras'], start=1)])
+
+
+def _compilar_regra(posicao, regra):
+    if not isinstance(regra, dict):
+        raise RegraInvalida('Cada regra deve ser um objeto JSON.')
+    nome = regra.get('nome', f'Validação {posicao}')
+    tipos = [t for t in TIPOS if t in regra]
+    if len(tipos) != 1:
+        raise RegraInvalida(f'{nome}: use exatamente um de {", ".join(TIPOS)}.')
+    tipo = tipos[0]
+
+    if tipo in ('preenchidas', 'unicas'):
+        colunas = regra[tipo]
+        if not isinstance(colunas, list) or not colunas:
+            raise RegraInvalida(f'{nome}: "{tipo}" espera uma lista de colunas.')
+        if tipo == 'preenchidas':
+            def violacoes(df, mascaras):
+                return df[colunas].isna().to_numpy().any(axis=1)
+        else:
+            def violacoes(df, mascaras):
+                return df.duplicated(colunas, keep=False).to_numpy()
+        return nome, set(colunas), violacoes
+
+    if not isinstance(regra['exige'], list) or not regra['exige']:
+        raise RegraInvalida(f'{nome}: "exige" espera uma lista de condições.')
+    condicoes = [compilar_condicao(nome, c) for c in regra['exige']]
+    colunas = set()
+    for coluna, _, valor in regra['exige']:
+        colunas.add(coluna)
+        if isinstance(valor, dict):
+            colunas.add(valor['coluna'])
+    nulas = sorted(colunas)
+
+    def violacoes(df, mascaras):
+        falha = np.zeros(len(df), dtype=bool)
+        for chave, avaliar in condicoes:
+            if chave not in mascaras:
+                mascaras[chave] = avaliar(df)
+            falha |= ~mascaras[chave]
+        return falha & ~df[nulas].isna().to_numpy().any(axis=1)
+
+    return nome, colunas, violacoes
+
+
+class Validador:
+    """Conjunto de validações compilado; chame com um DataFrame."""
+
+    def __init__(self, regras):
+        self.regras = regras
+
+    def colunas(self):
+        return set().union(*(colunas for _, colunas, _ in self.regras))
+
+    def __call__(self, df, exemplos=EXEMPLOS):
+        """Validacao(relatorio, invalidas): uma linha por regra e a máscara das linhas com alguma violação."""
+        faltando = self.colunas() - set(df.columns)
+        if faltando:
+            raise ValueError(f"colunas faltando: {', '.join(sorted(faltando))}")
+        invalidas = np.zeros(len(df), dtype=bool)
+        mascaras = {}
+        linhas = []
+        for nome, _, violacoes in self.regras:
+            mascara = violacoes(df, mascaras)
+            invalidas |= mascara
+            posicoes = np.flatnonzero(mascara)
+            linhas.append({
+                'regra': nome,
+                'violações': len(posicoes),
+                'exemplos': df.index[posicoes[:exemplos]].tolist(),
+            })
+        return Validacao(pd.DataFrame(linhas, columns=['regra', 'violações', 'exemplos']), invalidas)
+
+
+def validar(df, conjunto, exemplos=EXEMPLOS):
+    return compilar(conjunto)(df, exemplos)
@@ -0,0 +1,31 @@
+"""
+Registro das páginas da apresentação.
+
+Cada seção vive no próprio módulo e só é importada na primeira vez que
+alguém a abre. Bibliotecas pesadas (pandas, numpy, plotly) são importadas
+apenas pelas páginas que desenham gráficos, então as páginas só de texto
+não pagam esse custo.
+"""
+
+import importlib
+
+# Título exibido na navegação -> módulo dentro deste pacote
+PAGINAS = {
+    "🏠 Início": "inicio",
+    "🤔 O que é Streamlit?": "o_que_e",
+    "⚔️ Streamlit vs Power BI": "streamlit_vs_powerbi",
+    "🎯 Quando usar cada um": "quando_usar",
+    "🔄 Caso: ETL + Dashboard": "caso_etl",
+    "🔥 Demo ao Vivo": "demo_ao_vivo",
+    "☁️ Como Publicar": "como_publicar",
+    "🎓 Conclusão": "conclusao",
+}
+
+
+def carregar(titulo):
+    """Importa (uma única vez por processo) o módulo da página."""
+    return importlib.import_module(f"{__name__}.{PAGINAS[titulo]}")
+
+
+def renderizar(titulo):
+    carregar(titulo).renderizar()
@@ -0,0 +1,387 @@
+"""
+Página: Caso ETL + Dashboard
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import hashlib
+import json
+import os
+import uuid
+from functools import partial
+from pathlib import Path
+
+from componentes import carregamento, graficos, medicao
+from componentes.download import botoes_download
+from nucleo import etl, lote, validacao
+from nucleo.regras import RegraInvalida, carregar_regras, colunas_usadas, compilar, descrever, como_python
+
+ARQUIVO_REGRAS = Path(__file__).resolve().parent.parent / "config" / "regras_comissao.json"
+COLUNAS_ETL = ["vendedor", "vendas", "meta", "nivel", "categoria"]
+CACHE_ETL = Path(os.environ.get("ETL_CACHE", Path(__file__).resolve().parent.parent / ".cache" / "etl"))
+VALIDACAO = validacao.carregar_validacao(ARQUIVO_REGRAS.with_name("validacao_vendas.json"))
+
+
+def grafico_vendas_meta(dados):
+    fig = px.bar(
+        dados,
+        x='vendedor',
+        y=['vendas', 'meta'],
+        barmode='group',
+        title='Vendas vs Meta por Vendedor',
+        color_discrete_map={'vendas': '#4ade80', 'meta': '#f87171'}
+    )
+    fig.update_layout(**graficos.TEMA_ESCURO)
+    return fig
+
+
+def grafico_comissoes(dados):
+    fig = px.pie(
+        dados,
+        values='comissao',
+        names='vendedor',
+        title='Distribuição de Comissões'
+    )
+    fig.update_layout(**graficos.TEMA_ESCURO)
+    return fig
+
+
+def regras_da_sessao():
+    """
+    Regras vigentes e o eventual erro de edição: as editadas nesta sessão ou,
+    por padrão, as de config/regras_comissao.json.
+    """
+    padrao = carregar_regras(ARQUIVO_REGRAS)
+    texto = st.session_state.get("regras_comissao_json")
+    if texto is None:
+        st.session_state["regras_comissao_json"] = json.dumps(padrao, indent=2, ensure_ascii=False)
+        return padrao, None
+    try:
+        editadas = json.loads(texto)
+        avaliar = compilar(editadas)
+        faltando = colunas_usadas(editadas) - set(COLUNAS_ETL)
+        if faltando:
+            raise RegraInvalida(f"colunas inexistentes: {', '.join(sorted(faltando))}")
+        # Tipos incompatíveis com as colunas (ex.: "nivel" > 5) só aparecem ao avaliar
+        avaliar(vendas_do_mes().merge(metas_do_mes(), on='vendedor'))
+    except (json.JSONDecodeError, RegraInvalida) as erro:
+        return padrao, erro
+    except (TypeError, ValueError) as erro:
+        return padrao, RegraInvalida(f"as regras não se aplicam aos dados de vendas ({erro})")
+    return editadas, None
+
+
+def tratar(brutos, regras):
+    with medicao.trecho("etl: regras de comissão"):
+        return etl.tratar_vendas(brutos, regras)
+
+
+def id_sessao():
+    """Identificador desta sessão, para nomear a tabela tratada dela."""
+    return st.session_state.setdefault("etl_sessao", uuid.uuid4().hex)
+
+
+def versao_regras(regras):
+    return hashlib.sha1(json.dumps(regras, sort_keys=True).encode()).hexdigest()
+
+
+@st.cache_data(show_spinner=False)
+def vendas_do_mes():
+    """Fonte de vendas (no lugar do sistema de vendas): vendedor, vendas, nível e categoria."""
+    return pd.DataFrame({
+        'vendedor': ['Ana', 'Bruno', 'Carlos', 'Diana', 'Eduardo'],
+        'vendas': [15000, 8000, 22000, 18000, 5000],
+        'nivel': ['Senior', 'Junior', 'Senior', 'Pleno', 'Junior'],
+        'categoria': ['Premium', 'Standard', 'Premium', 'Standard', 'Standard']
+    })
+
+
+@st.cache_data(show_spinner=False)
+def metas_do_mes():
+    """Fonte de metas (no lugar da planilha do comercial): vendedor e meta."""
+    return pd.DataFrame({
+        'vendedor': ['Ana', 'Bruno', 'Carlos', 'Diana', 'Eduardo'],
+        'meta': [12000, 10000, 15000, 15000, 10000],
+    })
+
+
+# Até ~500 MB de CSV por entrada: poucas entradas, e só enquanto alguém está testando
+@st.cache_data(show_spinner=False, max_entries=2, ttl="15m")
+def filiais_simuladas(n):
+    return lote.filiais_simuladas(n)
+
+
+def secao_lote(regras):
+    """ETL em lote: um arquivo por filial, em paralelo em um pool de processos."""
+    st.markdown("### 📦 ETL em lote: um arquivo por filial")
+    st.markdown("Cada arquivo é lido, validado e tratado em um processo separado, usando todos os núcleos; "
+                "um arquivo com problema vira uma linha no relatório de erros, sem derrubar o lote.")
+
+    enviados = st.file_uploader("Arquivos das filiais (CSV ou Excel)", type=["csv", "xlsx"],
+                                accept_multiple_files=True, key="etl_lote_arquivos")
+    col1, col2 = st.columns(2)
+    with col1:
+        simuladas = st.number_input("Filiais simuladas (sem arquivos enviados)", 2, 500, 64,
+                                    key="etl_lote_filiais", disabled=bool(enviados),
+                                    help="20 mil vendas por filial, algumas com nível inválido; "
+                                         "a primeira vem sem a coluna meta")
+    with col2:
+        processos = st.number_input("Processos", 1, 64, min(os.cpu_count() or 1, 64), key="etl_lote_processos")
+
+    if st.button("▶️ Processar lote", key="etl_lote_rodar"):
+        if enviados:
+            arquivos = [(arquivo.name, arquivo.getvalue()) for arquivo in enviados]
+        else:
+            arquivos = filiais_simuladas(simuladas)
+        barra = st.progress(0.0, text="Iniciando processos...")
+
+        def progresso(concluidos, total, nome):
+            barra.progress(concluidos / total, text=f"{concluidos}/{total} arquivos · {nome}")
+
+        with medicao.trecho("etl: lote"):
+            st.session_state["etl_lote"] = lote.processar_lote(arquivos, regras, VALIDACAO,
+                                                               processos=processos, progresso=progresso)
+        barra.empty()
+
+    resultado = st.session_state.get("etl_lote")
+    if resultado is None:
+        return
+    dados, erros = resultado.dados, resultado.erros
+    arquivos_ok = dados["arquivo"].nunique() if len(dados) else 0
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Arquivos tratados", f"{arquivos_ok:,}")
+    col2.metric("Arquivos com erro", f"{len(erros):,}")
+    col3.metric("Linhas", f"{len(dados):,}")
+    col4.metric("Tempo", f"{resultado.segundos:.1f} s")
+    if len(erros):
+        st.error("Arquivos com erro:")
+        st.dataframe(erros, use_container_width=True, hide_index=True)
+    if len(resultado.validacao):
+        violacoes = resultado.validacao["violações"].sum()
+        st.caption(f"Validação: {violacoes:,} violações; as linhas inválidas ficaram fora dos dados tratados")
+        with st.expander("🔎 Relatório de validação por arquivo"):
+            st.dataframe(resultado.validacao[resultado.validacao["violações"] > 0],
+                         use_container_width=True, hide_index=True)
+    if len(dados):
+        por_arquivo = dados.groupby("arquivo", sort=True)[["vendas", "comissao"]].sum()
+        por_arquivo["% bateu meta"] = dados.groupby("arquivo", sort=True)["bateu_meta"].mean() * 100
+        st.dataframe(por_arquivo.round(1), use_container_width=True)
+        botoes_download(dados, "etl_lote", chave="download_etl_lote")
+
+
+def renderizar():
+    # As fontes do mini ETL carregam enquanto o texto da página é desenhado
+    vendas = carregamento.disparar(vendas_do_mes)
+    metas = carregamento.disparar(metas_do_mes)
+
+    st.markdown('<h2 class="section-title">Caso Prático: ETL + Dashboard</h2>', unsafe_allow_html=True)
+
+    st.markdown("""
+    ### 🎯 O Cenário
+    Você precisa criar uma solução que:
+    1. **Receba dados brutos** (Excel, CSV, ou banco)
+    2. **Trate e transforme** (limpeza, validação, cálculos)
+    3. **Apresente em dashboard** (gráficos, filtros, KPIs)
+    """)
+
+    st.markdown("---")
+
+    # Comparação lado a lado
+    st.markdown("### ⚔️ Como cada ferramenta resolveria isso?")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div style="background: #F2C811; color: black; padding: 1rem; border-radius: 10px; text-align: center;">
+            <h3>📊 Power BI</h3>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        #### Fluxo no Power BI:
+        """)
+
+        st.warning("""
+        1. **Importar dados** no Power Query
+        2. **Transformar** usando interface visual (M language por trás)
+        3. **Criar modelo** com relacionamentos
+        4. **Escrever DAX** para métricas calculadas
+        5. **Montar visuais** arrastando campos
+        6. **Publicar** no Power BI Service
+        """)
+
+        st.error("""
+        **Problemas comuns:**
+        - ❌ Regras de negócio complexas viram DAX ilegível
+        - ❌ Validações customizadas são limitadas
+        - ❌ Não dá pra rodar Python/scripts livremente
+        - ❌ Transformações avançadas exigem M (linguagem própria)
+        - ❌ Difícil versionar e revisar mudanças (não é código)
+        """)
+
+    with col2:
+        st.markdown("""
+        <div style="background: #306998; color: white; padding: 1rem; border-radius: 10px; text-align: center;">
+            <h3>🐍 Streamlit</h3>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        #### Fluxo no Streamlit:
+        """)
+
+        st.success("""
+        1. **Carregar dados** com Pandas (qualquer fonte)
+        2. **Transformar** com Python puro (lógica que você já sabe)
+        3. **Validar** com regras customizadas
+        4. **Criar gráficos** com Plotly/Altair
+        5. **Adicionar filtros** interativos
+        6. **Publicar** no Streamlit Cloud (grátis)
+        """)
+
+        st.success("""
+        **Vantagens claras:**
+        - ✅ Qualquer lógica Python funciona
+        - ✅ Bibliotecas de ETL prontas (Pandas, NumPy)
+        - ✅ Validações complexas são triviais
+        - ✅ Código versionável (Git)
+        - ✅ Testes automatizados possíveis
+        - ✅ Reutilização de funções
+        """)
+
+    st.markdown("---")
+
+    # Exemplo prático comparativo
+    st.markdown("### 💻 Exemplo: Calcular comissão com regras complexas")
+
+    # Regras vêm de config/regras_comissao.json (ou do editor abaixo)
+    regras, erro = regras_da_sessao()
+
+    st.markdown("**Regra de negócio:**\n" + descrever(regras))
+
+    with st.expander("🛠️ Editar regras (JSON)"):
+        st.text_area("Regras de comissão", height=300, key="regras_comissao_json")
+        if erro:
+            st.error(f"❌ Regras inválidas, usando as padrão: {erro}")
+        st.caption("As regras são compiladas uma vez e reaproveitadas entre reruns e sessões.")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### No Power BI (DAX):")
+        st.code("""
+Comissao =
+VAR MetaBatida = [Vendas] >= [Meta]
+VAR Superou20 = [Vendas] >= [Meta] * 1.2
+VAR Senior = RELATED(Vendedor[Nivel]) = "Senior"
+VAR Premium = RELATED(Produto[Categoria]) = "Premium"
+VAR BaseComissao =
+    SWITCH(
+        TRUE(),
+        Superou20, 0.15,
+        MetaBatida, 0.10,
+        0
+    )
+VAR BonusSenior = IF(Senior && MetaBatida, 0.05, 0)
+VAR Multiplicador = IF(Premium, 2, 1)
+RETURN
+    [Vendas] * (BaseComissao + BonusSenior) * Multiplicador
+        """, language="text")
+        st.error("😵 Difícil de ler, debugar e manter!")
+
+    with col2:
+        st.markdown("#### No Streamlit (Python):")
+        st.code(como_python(regras), language="python")
+        st.success("✅ Legível, testável, fácil de manter!")
+
+    st.markdown("---")
+
+    # Demo interativa
+    st.markdown("### 🎮 Teste você mesmo: Mini ETL ao vivo")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### 📥 Dados Brutos:")
+        # Vendas e metas vêm de fontes independentes: chegam juntas, não uma depois da outra
+        espaco = carregamento.reservar("Carregando vendas e metas...", altura=240)
+        with medicao.trecho("etl: fontes"):
+            dados_brutos = vendas.result().merge(metas.result(), on='vendedor', how='left')[COLUNAS_ETL]
+        with espaco.container():
+            dados_brutos = st.data_editor(dados_brutos, use_container_width=True, num_rows="dynamic",
+                                          key="etl_dados_brutos")
+
+        # Validações de config/validacao_vendas.json: linhas inválidas ficam fora do ETL
+        with medicao.trecho("etl: validação"):
+            relatorio, invalidas = validacao.validar(dados_brutos, VALIDACAO)
+        if invalidas.any():
+            st.warning(f"⚠️ {invalidas.sum()} linha(s) inválida(s) fora do ETL:")
+            st.dataframe(relatorio[relatorio["violações"] > 0], use_container_width=True, hide_index=True)
+            dados_brutos = dados_brutos[~invalidas]
+        else:
+            st.caption(f"✅ {len(relatorio)} validações, nenhuma violação")
+
+        incremental = st.toggle("♻️ ETL incremental", value=True, key="etl_incremental",
+                                help="Só linhas novas ou alteradas (pelo hash da linha) passam pelas "
+                                     "transformações; as outras vêm da tabela tratada gravada")
+
+    with col2:
+        st.markdown("#### ⚙️ Dados Tratados (ETL aplicado):")
+
+        # Regras compiladas, aplicadas à coluna inteira
+        if incremental:
+            # Uma tabela gravada por sessão: edições de outras sessões não forçam recálculo aqui
+            etl.limpar(CACHE_ETL)
+            dados_tratados, resumo = etl.atualizar(dados_brutos, "vendedor", partial(tratar, regras=regras),
+                                                   CACHE_ETL / f"sessao-{id_sessao()}.feather",
+                                                   versao=versao_regras(regras))
+        else:
+            dados_tratados = tratar(dados_brutos, regras)
+
+        st.dataframe(dados_tratados, use_container_width=True)
+        if incremental:
+            st.caption(f"♻️ {resumo.reaproveitadas} linhas reaproveitadas · {resumo.recalculadas} recalculadas "
+                       f"({resumo.novas} novas) · {resumo.removidas} removidas")
+        botoes_download(dados_tratados, "dados_tratados", chave="download_etl")
+
+    # Dashboard com os dados tratados
+    st.markdown("---")
+    st.markdown("#### 📊 Dashboard com dados tratados:")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Vendas", f"R$ {dados_tratados['vendas'].sum():,.0f}")
+    with col2:
+        st.metric("Total Comissões", f"R$ {dados_tratados['comissao'].sum():,.0f}")
+    with col3:
+        taxa_bateu = dados_tratados['bateu_meta'].mean() * 100 if len(dados_tratados) else 0
+        st.metric("% Bateu Meta", f"{taxa_bateu:.0f}%")
+
+    col1, col2 = st.columns(2)
+
+    # Só as colunas usadas entram no hash do cache de figuras
+    with col1:
+        graficos.exibir(grafico_vendas_meta, dados_tratados[['vendedor', 'vendas', 'meta']])
+
+    with col2:
+        graficos.exibir(grafico_comissoes, dados_tratados[['vendedor', 'comissao']])
+
+    st.markdown("---")
+
+    secao_lote(regras)
+
+    st.markdown("---")
+
+    st.success("""
+    ### 🏆 Conclusão deste caso:
+
+    Para **ETL + Dashboard** com regras de negócio customizadas, **Streamlit vence** porque:
+
+    1. **Tratamento de dados** é Python puro (Pandas) - mais poderoso que Power Query
+    2. **Lógica de negócio** é código legível - não DAX críptico
+    3. **Tudo em um lugar** - ETL e visualização no mesmo código
+    4. **Versionável** - Git para controle de mudanças
+    5. **Testável** - você pode criar testes unitários para suas regras
+    """)
@@ -0,0 +1,114 @@
+"""
+Página: Como Publicar
+"""
+
+import streamlit as st
+
+
+def renderizar():
+    st.markdown('<h2 class="section-title">Como Publicar seu App</h2>', unsafe_allow_html=True)
+
+    st.markdown("### 🌐 Streamlit Community Cloud (Grátis!)")
+
+    st.markdown("""
+    O Streamlit oferece hospedagem gratuita para seus apps. Qualquer pessoa com o link pode acessar!
+    """)
+
+    # Passos
+    st.markdown("### 📋 Passo a Passo:")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        <div class="step-card">
+            <h3>1️⃣ Prepare o Projeto</h3>
+            <p>Crie um repositório no GitHub com:</p>
+            <code>app.py</code><br><br>
+            <code>requirements.txt</code>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="step-card">
+            <h3>2️⃣ Conecte</h3>
+            <p>Acesse:</p>
+            <a href="https://share.streamlit.io" target="_blank" style="color: #58a6ff;">share.streamlit.io</a>
+            <p>Faça login com GitHub e conecte seu repositório</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="step-card">
+            <h3>3️⃣ Deploy!</h3>
+            <p>Clique em Deploy e aguarde.</p>
+            <p>Você receberá uma URL pública:</p>
+            <code>seuapp.streamlit.app</code>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Estrutura do projeto
+    st.markdown("### 📁 Estrutura mínima do projeto:")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**app.py** (seu código)")
+        st.code("""
+import streamlit as st
+import pandas as pd
+
+st.title("Meu App")
+# ... seu código
+        """, language="python")
+
+    with col2:
+        st.markdown("**requirements.txt** (dependências)")
+        st.code("""
+streamlit
+pandas
+plotly
+        """, language="text")
+
+    st.markdown("---")
+
+    # Limitações
+    with st.expander("⚠️ Limitações do plano gratuito"):
+        st.markdown("""
+        - **Recursos limitados:** RAM e CPU são compartilhados
+        - **Apps pesados:** Podem ficar lentos
+        - **Sleep automático:** Apps inativos "dormem" e demoram para acordar
+        - **Banco privado:** Se seu banco não é público, pode precisar de configuração extra
+
+        **Para uso corporativo sério:** Considere deploy em servidor próprio (AWS, Azure, etc.)
+        """)
+
+    with st.expander("🔐 Como usar senhas/tokens com segurança"):
+        st.markdown("""
+        **Nunca coloque senhas no código!**
+
+        Use o sistema de Secrets do Streamlit:
+
+        1. No Streamlit Cloud, vá em Settings > Secrets
+        2. Adicione suas variáveis:
+        ```toml
+        [database]
+        host = "seu-servidor"
+        password = "sua-senha-segura"
+        ```
+        3. No código, acesse assim:
+        ```python
+        senha = st.secrets["database"]["password"]
+        ```
+        4. Para consultas, prefira um pool compartilhado a abrir uma conexão por sessão:
+        com `driver = "psycopg"` (ou outro módulo DB-API) e `marcador = "%s"` na seção
+        `[database]`, o `componentes/banco.py` monta o pool e o cache de consultas:
+        ```python
+        pedidos = banco.fonte().consultar(
+            "pedidos", ["pedido_id", "nota"], [["estado_cliente", "em", ["SP"]]])
+        ```
+        """)
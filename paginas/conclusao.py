@@ -0,0 +1,99 @@
+"""
+Página: Conclusão
+"""
+
+import streamlit as st
+
+
+def renderizar():
+    st.markdown('<h2 class="section-title">Conclusão</h2>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div style="text-align: center; padding: 2rem;">
+        <h3>🎯 Resumo Final</h3>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div style="background: #306998; color: white; padding: 2rem; border-radius: 15px; text-align: center;">
+            <h3>🐍 Streamlit</h3>
+            <p><em>"Um app que você programou com Python"</em></p>
+            <br>
+            <p>✅ Flexibilidade total</p>
+            <p>✅ Integra com tudo de Python</p>
+            <p>✅ De script a produto</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div style="background: #F2C811; color: black; padding: 2rem; border-radius: 15px; text-align: center;">
+            <h3>📊 Power BI</h3>
+            <p><em>"PowerPoint de dados + modelo analítico"</em></p>
+            <br>
+            <p>✅ BI corporativo pronto</p>
+            <p>✅ Governança enterprise</p>
+            <p>✅ Visual drag-and-drop</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    st.markdown("### 💡 A mensagem que fica:")
+
+    st.success("""
+    **Streamlit e Power BI não são concorrentes — são complementares.**
+
+    - Power BI domina o **BI corporativo pronto**
+    - Streamlit domina o **app personalizado com lógica Python**
+
+    **Se você sabe Python, Streamlit vira uma arma — e Power BI vira só mais uma ferramenta.**
+    """)
+
+    st.markdown("---")
+
+    # Próximos passos
+    st.markdown("### 🚀 Próximos passos sugeridos:")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        **1. Pratique**
+        - Pegue um script seu
+        - Transforme em app Streamlit
+        - Adicione interatividade
+        """)
+
+    with col2:
+        st.markdown("""
+        **2. Publique**
+        - Crie conta no GitHub
+        - Faça deploy no Streamlit Cloud
+        - Compartilhe o link
+        """)
+
+    with col3:
+        st.markdown("""
+        **3. Evolua**
+        - Explore a documentação
+        - Veja a galeria de apps
+        - Crie seu portfólio
+        """)
+
+    st.markdown("---")
+
+    st.markdown("""
+    <div style="text-align: center; padding: 2rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 15px; color: white;">
+        <h2>Obrigado! 🎉</h2>
+        <p>Dúvidas? Vamos conversar!</p>
+        <br>
+        <p><strong>Recursos úteis:</strong></p>
+        <p>📚 Documentação: <a href="https://docs.streamlit.io" style="color: #FFD700;">docs.streamlit.io</a></p>
+        <p>🎨 Galeria: <a href="https://streamlit.io/gallery" style="color: #FFD700;">streamlit.io/gallery</a></p>
+        <p>💬 Comunidade: <a href="https://discuss.streamlit.io" style="color: #FFD700;">discuss.streamlit.io</a></p>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,284 @@
+"""
+Página: Demo ao Vivo
+"""
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import random
+
+from componentes import graficos, medicao
+from componentes.download import botoes_download
+from componentes.tabela import tabela_paginada
+from nucleo import ingestao, perfil
+from nucleo.tempo_real import BufferCircular, passeio_vendas
+
+PONTOS_NA_TELA = 300
+PONTOS_POR_ATUALIZACAO = 5
+INTERVALO_AO_VIVO = 1.0  # segundos
+
+
+@st.cache_resource
+def serie_longa(anos=5, seed=7):
+    """Vendas simuladas a cada 10 minutos: ~260 mil pontos, gerados uma vez por processo."""
+    instantes = pd.date_range("2020-01-01", periods=anos * 365 * 144, freq="10min")
+    rng = np.random.default_rng(seed)
+    horas = instantes.hour.to_numpy() + instantes.minute.to_numpy() / 60
+    dias = np.arange(len(instantes)) / 144
+    vendas = (200 + 0.05 * dias + 60 * np.sin(2 * np.pi * (horas - 9) / 24)
+              + 40 * np.sin(2 * np.pi * dias / 365) + rng.normal(0, 15, len(instantes)).cumsum() * 0.05
+              + rng.normal(0, 20, len(instantes)))
+    return pd.DataFrame({"instante": instantes, "vendas": vendas.round(2)})
+
+
+def csv_enviado(arquivo):
+    """
+    Arquivo enviado, interpretado e perfilado uma única vez por conteúdo
+    nesta sessão: {"hash", "df", "perfil"}. Os reruns seguintes (de
+    qualquer widget) reaproveitam o resultado guardado em session_state.
+    """
+    atual = st.session_state.get("upload_csv")
+    if atual and atual["arquivo_id"] == arquivo.file_id:
+        return atual
+
+    chave = ingestao.hash_conteudo(arquivo)
+    if not (atual and atual["hash"] == chave):
+        barra = st.progress(0.0, text="Lendo CSV...")
+        df = ingestao.ler_csv(arquivo, progresso=lambda f: barra.progress(f, text=f"Lendo CSV... {f:.0%}"))
+        barra.empty()
+        with st.spinner("Calculando o perfil das colunas..."):
+            perfis = perfil.perfilar(df)
+        atual = {"hash": chave, "df": df, "perfil": perfis}
+    atual = {**atual, "arquivo_id": arquivo.file_id}
+    st.session_state["upload_csv"] = atual
+    return atual
+
+
+def barras_aleatorias():
+    """Gráfico com dados novos a cada clique; o clique reexecuta só este fragmento."""
+    meses = ["Jan", "Fev", "Mar", "Abr", "Mai", "Jun"]
+    vendas = [random.randint(100, 500) for _ in range(6)]
+
+    df = pd.DataFrame({"Mês": meses, "Vendas": vendas})
+    fig = px.bar(df, x="Mês", y="Vendas", color="Vendas",
+                color_continuous_scale="Blues")
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.button("🔄 Gerar novos dados")
+
+
+def ticker_vendas():
+    """
+    Modo ao vivo: a cada execução do fragmento chegam pontos novos, que
+    entram no buffer circular da sessão; só este trecho da página é redesenhado.
+    """
+    if "ticker_vendas" not in st.session_state:
+        st.session_state["ticker_vendas"] = (BufferCircular(PONTOS_NA_TELA), np.random.default_rng())
+    buffer, rng = st.session_state["ticker_vendas"]
+
+    ultimo = buffer.ultimo()
+    buffer.adicionar(passeio_vendas(rng, 300.0 if ultimo is None else ultimo[0], PONTOS_POR_ATUALIZACAO))
+
+    vendas = buffer.dados()[:, 0]
+    fig = px.line(x=range(buffer.total - len(vendas), buffer.total), y=vendas,
+                  labels={"x": "Ponto", "y": "Vendas"}, title="Vendas em tempo real")
+    fig.update_traces(line_color="#60a5fa")
+    fig.update_layout(**graficos.TEMA_ESCURO)
+    st.plotly_chart(fig, use_container_width=True, key="ticker_vendas_grafico")
+    st.caption(f"{buffer.total:,} pontos recebidos · últimos {len(buffer)} na tela · "
+               f"atualiza a cada {INTERVALO_AO_VIVO:g}s, sem reexecutar a página")
+
+
+def grafico_histograma(faixas, coluna):
+    fig = px.bar(faixas, x='centro', y='linhas', title=f'Distribuição de {coluna}',
+                 hover_data=['inicio', 'fim'], labels={'centro': coluna, 'linhas': 'Linhas'})
+    fig.update_layout(**graficos.TEMA_ESCURO, bargap=0.02)
+    return fig
+
+
+def grafico_frequentes(frequentes, coluna):
+    fig = px.bar(frequentes, x='valor', y='linhas', title=f'Valores mais frequentes de {coluna}',
+                 labels={'valor': coluna, 'linhas': 'Linhas'})
+    fig.update_layout(**graficos.TEMA_ESCURO)
+    fig.update_xaxes(type='category')
+    return fig
+
+
+def painel_perfil(perfis):
+    """Tabela com o perfil de cada coluna e o gráfico da coluna escolhida."""
+    st.dataframe(perfil.tabela(perfis), use_container_width=True, hide_index=True)
+    por_nome = {str(p["coluna"]): p for p in perfis}
+    escolhida = por_nome[st.selectbox("Coluna", list(por_nome), key="upload_perfil_coluna")]
+    if escolhida["histograma"] is not None:
+        contagens, bordas = escolhida["histograma"]
+        faixas = pd.DataFrame({"inicio": bordas[:-1], "fim": bordas[1:],
+                               "centro": (bordas[:-1] + bordas[1:]) / 2, "linhas": contagens})
+        graficos.exibir(grafico_histograma, faixas, coluna=str(escolhida["coluna"]))
+    elif escolhida["topo"]:
+        frequentes = pd.DataFrame(escolhida["topo"], columns=["valor", "linhas"]).astype({"valor": str})
+        graficos.exibir(grafico_frequentes, frequentes, coluna=str(escolhida["coluna"]))
+
+
+def renderizar():
+    st.markdown('<h2 class="section-title">Demo ao Vivo - Veja o Código em Ação!</h2>', unsafe_allow_html=True)
+
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 Gráficos", "📁 Upload", "🎛️ Widgets", "📥 Download"])
+
+    # TAB 1: Gráficos
+    with tab1:
+        st.markdown("### Gráfico interativo em 5 linhas de código")
+
+        ao_vivo = st.toggle("📡 Modo ao vivo", key="demo_modo_ao_vivo",
+                            help="Atualiza só o gráfico, com pontos novos a cada segundo")
+
+        col1, col2 = st.columns([1, 2])
+
+        with col1:
+            if ao_vivo:
+                st.code("""
+# Só esta função roda de novo a cada segundo;
+# o resto da página não é reexecutado
+@st.fragment(run_every=1.0)
+def ticker():
+    buffer = st.session_state["buffer"]  # tamanho fixo
+    buffer.adicionar(novos_pontos())
+    st.plotly_chart(px.line(y=buffer.dados()))
+
+ticker()
+            """, language="python")
+            else:
+                st.code("""
+# Gerar dados fictícios
+import pandas as pd
+import plotly.express as px
+
+df = pd.DataFrame({
+    "Mês": meses,
+    "Vendas": valores
+})
+
+fig = px.bar(df, x="Mês", y="Vendas")
+st.plotly_chart(fig)
+            """, language="python")
+
+        with col2:
+            # Fragmentos: cliques e atualizações reexecutam só o gráfico
+            if ao_vivo:
+                st.fragment(ticker_vendas, run_every=INTERVALO_AO_VIVO)()
+            else:
+                st.fragment(barras_aleatorias)()
+
+        st.markdown("---")
+        st.markdown("### 📈 Séries longas sem travar o navegador")
+        serie = serie_longa()
+        primeiro, ultimo = serie["instante"].iloc[0].date(), serie["instante"].iloc[-1].date()
+        inicio, fim = st.slider("Período", min_value=primeiro, max_value=ultimo, value=(primeiro, ultimo),
+                                format="DD/MM/YYYY", key="demo_serie_periodo")
+        # A faixa escolhida é reduzida no servidor (LTTB) a ~1 ponto por pixel
+        graficos.exibir_serie(serie, "instante", "vendas",
+                              faixa=(pd.Timestamp(inicio), pd.Timestamp(fim) + pd.Timedelta(days=1)),
+                              titulo="Vendas a cada 10 minutos")
+        st.caption("Cada período escolhido é reduzido e guardado em cache uma vez; "
+                   "com muitos pontos, o gráfico usa WebGL (Scattergl).")
+
+    # TAB 2: Upload
+    with tab2:
+        st.markdown("### Upload e processamento de arquivo")
+
+        st.code("""
+arquivo = st.file_uploader("Envie seu CSV", type="csv")
+if arquivo:
+    df = pd.read_csv(arquivo)
+    st.dataframe(df)
+        """, language="python")
+
+        arquivo = st.file_uploader("📤 Envie um arquivo CSV para testar", type="csv")
+
+        if arquivo:
+            try:
+                with medicao.trecho("upload: leitura e perfil"):
+                    upload = csv_enviado(arquivo)
+            except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError) as erro:
+                st.error(f"Não foi possível ler o CSV: {erro}")
+            else:
+                df = upload["df"]
+                st.success(f"✅ Arquivo carregado! {len(df)} linhas encontradas.")
+                with st.expander(f"🔬 Perfil das {len(df.columns)} colunas", expanded=True):
+                    painel_perfil(upload["perfil"])
+                # Só a página visível vai para o navegador
+                with medicao.trecho("upload: tabela paginada"):
+                    tabela_paginada(df, upload["hash"], chave="upload")
+        else:
+            st.info("☝️ Faça upload de um CSV para ver a mágica acontecer!")
+
+            # Dados de exemplo
+            with st.expander("📋 Ver dados de exemplo"):
+                exemplo = pd.DataFrame({
+                    "Produto": ["Notebook", "Mouse", "Teclado", "Monitor"],
+                    "Quantidade": [10, 50, 30, 15],
+                    "Preço": [3500, 80, 200, 1200]
+                })
+                st.dataframe(exemplo)
+
+    # TAB 3: Widgets
+    with tab3:
+        st.markdown("### Widgets interativos")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("#### Entrada de dados")
+            nome = st.text_input("Seu nome:", "Estudante")
+            idade = st.slider("Sua idade:", 18, 60, 25)
+            curso = st.selectbox("Área:", ["TI", "Dados", "Negócios", "Design"])
+            aceita = st.checkbox("Aceito aprender Streamlit!")
+
+        with col2:
+            st.markdown("#### Resultado em tempo real")
+            if aceita:
+                st.success(f"""
+                👋 Olá, **{nome}**!
+
+                Você tem **{idade} anos** e trabalha com **{curso}**.
+
+                Pronto para dominar Streamlit! 🚀
+                """)
+            else:
+                st.warning("Marque a checkbox para ver a mágica! ✨")
+
+        st.markdown("---")
+        st.code("""
+nome = st.text_input("Seu nome:")
+idade = st.slider("Idade:", 18, 60, 25)
+curso = st.selectbox("Área:", ["TI", "Dados", "Negócios"])
+aceita = st.checkbox("Aceito aprender!")
+
+if aceita:
+    st.success(f"Olá, {nome}!")
+        """, language="python")
+
+    # TAB 4: Download
+    with tab4:
+        st.markdown("### Exportar dados para download")
+
+        st.code("""
+df = criar_relatorio()
+st.download_button(
+    "📥 Baixar CSV",
+    data=lambda: df.to_csv(index=False),  # só gera ao clicar
+    file_name="relatorio.csv"
+)
+        """, language="python")
+
+        # Criar relatório demo
+        relatorio = pd.DataFrame({
+            "Data": pd.date_range(start="2024-01-01", periods=10, freq="D"),
+            "Vendas": [random.randint(1000, 5000) for _ in range(10)],
+            "Clientes": [random.randint(10, 50) for _ in range(10)]
+        })
+
+        st.dataframe(relatorio, use_container_width=True)
+
+        # Cada arquivo só é gerado quando o botão correspondente é clicado
+        botoes_download(relatorio, "relatorio", chave="download_relatorio")
@@ -0,0 +1,46 @@
+"""
+Página: Início
+"""
+
+import streamlit as st
+
+
+def renderizar():
+    st.markdown('<h1 class="main-title">🚀 Streamlit: De Script a Produto</h1>', unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown("""
+        <div style="text-align: center; font-size: 1.3rem; color: #666;">
+            <p>Transforme seus scripts Python em aplicações web interativas</p>
+            <p><strong>Sem precisar virar desenvolvedor front-end</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Métricas animadas
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("📝 Linhas de código", "~50", "para um app completo")
+    with col2:
+        st.metric("⏱️ Tempo de aprendizado", "1 hora", "para começar")
+    with col3:
+        st.metric("🐍 Linguagem", "Python", "que você já sabe!")
+    with col4:
+        st.metric("💰 Custo", "Grátis", "open source")
+
+    st.markdown("---")
+
+    # O que vamos ver
+    st.markdown("### 📋 O que vamos ver hoje:")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.success("✅ O que é Streamlit e pra que serve")
+        st.success("✅ Comparação honesta com Power BI")
+        st.success("✅ Quando usar cada ferramenta")
+    with col2:
+        st.success("✅ Demonstração ao vivo com código")
+        st.success("✅ Como publicar seu app na internet")
+        st.success("✅ Exemplos práticos que você pode copiar")
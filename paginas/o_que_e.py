@@ -0,0 +1,76 @@
+"""
+Página: O que é Streamlit?
+"""
+
+import streamlit as st
+
+
+def renderizar():
+    st.markdown('<h2 class="section-title">O que é Streamlit?</h2>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown("""
+        **Streamlit** é um framework Python para criar **aplicações web interativas**
+        de forma simples e rápida.
+
+        ### A mágica acontece assim:
+        """)
+
+        st.code("""
+# Você escreve isso...
+import streamlit as st
+import pandas as pd
+
+st.title("Meu Dashboard")
+dados = pd.read_csv("vendas.csv")
+st.dataframe(dados)
+st.bar_chart(dados["valor"])
+        """, language="python")
+
+        st.markdown("### E o Streamlit transforma em uma aplicação web! 👆")
+
+    with col2:
+        st.markdown("### Você ganha de graça:")
+        st.markdown("""
+        - 🖱️ Botões
+        - 📊 Gráficos interativos
+        - 📁 Upload de arquivos
+        - 🔽 Filtros e selects
+        - 📋 Tabelas
+        - 📥 Download de dados
+        - 📄 Múltiplas páginas
+        - 🎨 Tema bonito
+        """)
+
+    st.markdown("---")
+
+    # Casos de uso
+    st.markdown("### 💼 Exemplos de uso real:")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        <div class="dark-card">
+            <h4>📈 Dashboard de Vendas</h4>
+            <p>Conecta no SQL Server, puxa dados, mostra KPIs e gráficos. Atualiza em tempo real.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="dark-card">
+            <h4>📄 Processador de PDF</h4>
+            <p>Upload de PDF → extrai dados → processa → exporta Excel. Tudo no navegador.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="dark-card">
+            <h4>🤖 App de ML</h4>
+            <p>Modelo de previsão onde o usuário insere dados e recebe a predição na hora.</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,506 @@
+"""
+Página: Quando usar cada um
+"""
+
+import streamlit as st
+import numpy as np
+import plotly.express as px
+import time
+from functools import partial
+
+from nucleo import cubo, esquema, estatistica, mapa, olist
+from nucleo.indices import IndiceBitmap
+from componentes import banco, carregamento, graficos, medicao
+
+FILTRAVEIS = ['estado_cliente', 'estado_vendedor', 'mes', 'nota']
+ROTULOS_MAPA = {'pct_atraso': '% Atrasos', 'frete_medio': 'Frete médio (R$)', 'pedidos': 'Pedidos'}
+
+
+@st.cache_resource(show_spinner="Carregando dados OLIST...", max_entries=2)
+def carregar_olist(assinatura):
+    """
+    Uma cópia por versão dos CSVs de origem, no esquema compacto e
+    compartilhada (somente leitura) por todas as sessões.
+    """
+    if assinatura is None:
+        df = esquema.compactar(olist.gerar_amostra())
+    else:
+        df = olist.carregar(olist.COLUNAS)
+    return df, esquema.relatorio_memoria(esquema.expandir(df), df)
+
+
+@st.cache_resource(show_spinner="Agregando cubo OLIST...", max_entries=2)
+def cubo_olist(assinatura):
+    """Cubo de agregados construído uma vez por versão dos dados."""
+    df, _ = carregar_olist(assinatura)
+    return cubo.construir(df)
+
+
+@st.cache_resource(show_spinner="Indexando filtros...", max_entries=2)
+def indices_olist(assinatura):
+    """Índices bitmap das células do cubo e das linhas, uma vez por versão dos dados."""
+    df, _ = carregar_olist(assinatura)
+    return (IndiceBitmap(cubo_olist(assinatura), FILTRAVEIS),
+            IndiceBitmap(cubo.dimensoes(df), FILTRAVEIS))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def estatisticas_olist(assinatura, filtros, reamostras):
+    """Mann-Whitney e ICs bootstrap, geral e por estado do cliente; um cálculo por combinação de filtros."""
+    celulas = cubo_olist(assinatura)
+    indice_celulas, _ = indices_olist(assinatura)
+    mascara = indice_celulas.mascara(filtros)
+    geral = estatistica.comparar(*estatistica.contagens(celulas, mascara=mascara), reamostras=reamostras)
+    por_estado = estatistica.comparar(*estatistica.contagens(celulas, 'estado_cliente', mascara),
+                                      reamostras=reamostras)
+    return geral, por_estado
+
+
+def painel_estatistico(versao, filtros):
+    """Reserva o painel e dispara o cálculo; devolve o painel para carregamento.preencher."""
+    st.markdown("#### 🧪 Painel estatístico: Atrasou × No Prazo")
+    reamostras = st.select_slider("Reamostras bootstrap", [1000, 2000, 5000, 10000], value=2000)
+    espaco = carregamento.reservar("Calculando testes e bootstrap...", altura=560)
+    futuro = carregamento.disparar(estatisticas_olist, versao, filtros, reamostras)
+    return espaco, futuro, partial(desenhar_estatisticas, reamostras=reamostras)
+
+
+def desenhar_estatisticas(estatisticas, reamostras):
+    geral, por_estado = estatisticas
+    linha = geral.iloc[0] if len(geral) else None
+    if linha is None or not (linha['n_atrasou'] and linha['n_no_prazo']):
+        st.warning("É preciso ter entregas atrasadas e no prazo nos filtros escolhidos.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Δ Nota média", f"{linha['dif_media']:+.2f}")
+        st.caption(f"IC 95%: [{linha['ic_media_inf']:+.2f}, {linha['ic_media_sup']:+.2f}]")
+    with col2:
+        st.metric("Δ Nota mediana", f"{linha['dif_mediana']:+.1f}")
+        st.caption(f"IC 95%: [{linha['ic_mediana_inf']:+.1f}, {linha['ic_mediana_sup']:+.1f}]")
+    with col3:
+        if np.isnan(linha['p_valor']):
+            st.metric("Mann-Whitney (p-valor)", "—")
+            st.caption("Todas as notas iguais: teste indefinido")
+        else:
+            st.metric("Mann-Whitney (p-valor)", f"{linha['p_valor']:.4f}")
+            st.caption("Diferença significativa a 5%" if linha['p_valor'] < 0.05 else "Sem diferença significativa a 5%")
+
+    estados = por_estado.dropna(subset=['dif_media'])[['grupo', 'dif_media', 'ic_media_inf', 'ic_media_sup']]
+    graficos.exibir(grafico_diferencas, estados, reamostras=reamostras)
+
+    with st.expander("📋 Tabela por estado"):
+        st.dataframe(por_estado.round(4), use_container_width=True, hide_index=True)
+
+
+def grafico_diferencas(estados, reamostras):
+    fig = px.scatter(estados, x='grupo', y='dif_media',
+                     error_y=estados['ic_media_sup'] - estados['dif_media'],
+                     error_y_minus=estados['dif_media'] - estados['ic_media_inf'],
+                     title=f'Δ Nota média (atrasou − no prazo) por estado do cliente, IC 95% ({reamostras:,} reamostras)',
+                     labels={'grupo': 'Estado do cliente', 'dif_media': 'Δ nota média'})
+    fig.add_hline(y=0, line_dash='dot', line_color='#888')
+    fig.update_layout(**graficos.TEMA_ESCURO)
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def geojson_brasil():
+    """GeoJSON dos estados, lido do disco uma vez por processo."""
+    return mapa.carregar_geojson()
+
+
+def mapa_atrasos(celulas, mascara, geojson):
+    """Agrega no script e reserva o lugar do mapa até o GeoJSON (`geojson`, um Future) chegar."""
+    st.markdown("#### 🗺️ Atrasos e frete por estado do cliente")
+    metrica = st.radio("Métrica", ["pct_atraso", "frete_medio"], horizontal=True,
+                       format_func={"pct_atraso": "% Atrasos", "frete_medio": "Frete médio (R$)"}.get)
+    # Agregado no servidor: uma linha por estado vai para o navegador
+    with medicao.trecho("olist: agregação do mapa"):
+        estados = mapa.por_estado(celulas, mascara)
+        # Fluxos interestaduais: matriz vendedor × cliente, também agregada no servidor
+        rotas = mapa.por_rota(celulas, mascara)
+        matriz = rotas.pivot(index='origem', columns='destino', values=metrica)
+    espaco = carregamento.reservar("Carregando o mapa...", altura=900)
+    return espaco, geojson, partial(desenhar_mapa, estados, matriz, metrica)
+
+
+def desenhar_mapa(estados, matriz, metrica, geojson):
+    # grafico_mapa relê o GeoJSON do cache de geojson_brasil, já preenchido
+    graficos.exibir(grafico_mapa, estados, metrica=metrica)
+    graficos.exibir(grafico_rotas, matriz, metrica=metrica)
+
+
+def condicoes_sql(filtros):
+    """Os filtros da página como condições de nucleo.sql (meses viram faixa de data_compra)."""
+    condicoes = [[coluna, 'em', list(filtros[coluna])]
+                 for coluna in ('estado_cliente', 'estado_vendedor', 'nota') if filtros[coluna]]
+    if filtros['mes']:
+        condicoes.append(['data_compra', '>=', f"{filtros['mes'][0].start_time:%Y-%m-%d}"])
+        condicoes.append(['data_compra', '<', f"{(filtros['mes'][-1] + 1).start_time:%Y-%m-%d}"])
+    return condicoes
+
+
+COLUNAS_SQL = ['pedido_id', 'estado_cliente', 'estado_vendedor', 'data_compra', 'nota', 'valor_pedido', 'frete']
+
+
+def consultar_pedidos(versao, olist_sample, condicoes):
+    """Pedidos filtrados no banco (roda fora da thread do script)."""
+    fonte = banco.fonte(versao, olist_sample)
+    consulta, parametros = fonte.montar('pedidos', COLUNAS_SQL, condicoes, ordem=['data_compra'], limite=1000)
+    inicio = time.perf_counter()
+    pedidos = fonte.sql(consulta, parametros, tabelas=['pedidos'])
+    return fonte, consulta, parametros, pedidos, time.perf_counter() - inicio
+
+
+def consulta_sql(versao, olist_sample, filtros):
+    """Reserva o resultado e dispara a consulta; devolve o painel para carregamento.preencher."""
+    st.markdown("#### 🗄️ Os mesmos filtros, direto no banco")
+    st.caption("Pool de conexões compartilhado pelo processo; só as colunas pedidas e as linhas filtradas "
+               "saem do banco, e cada consulta fica em cache por alguns minutos.")
+    # No on_click, a invalidação acontece antes da consulta do rerun seguinte
+    st.button("🔄 Invalidar cache da tabela pedidos", key="olist_sql_invalidar",
+              on_click=lambda: banco.fonte(versao, olist_sample).invalidar('pedidos'))
+    espaco = carregamento.reservar("Consultando o banco...", altura=400)
+    futuro = carregamento.disparar(consultar_pedidos, versao, olist_sample, condicoes_sql(filtros))
+    return espaco, futuro, desenhar_consulta
+
+
+def desenhar_consulta(resultado):
+    fonte, consulta, parametros, pedidos, segundos = resultado
+    st.code(f"{consulta}\n-- parâmetros: {list(parametros)}", language="sql")
+    st.caption(f"{len(pedidos):,} linhas em {segundos * 1000:.1f} ms "
+               f"· cache: {fonte.acertos:,} acertos, {fonte.faltas:,} idas ao banco")
+    st.dataframe(pedidos, use_container_width=True, hide_index=True)
+
+
+def grafico_mapa(estados, metrica):
+    fig = px.choropleth(estados, geojson=geojson_brasil(), locations='uf',
+                        featureidkey=f'properties.{mapa.PROPRIEDADE_UF}', color=metrica,
+                        hover_data=['pedidos', 'pct_atraso', 'frete_medio'], labels=ROTULOS_MAPA,
+                        color_continuous_scale='Reds')
+    fig.update_geos(fitbounds='locations', showcountries=True, countrycolor='#555',
+                    showland=True, landcolor='#1e1e2e', bgcolor='rgba(0,0,0,0)')
+    fig.update_layout(paper_bgcolor='rgba(0,0,0,0)', font_color='#e0e0e0', height=500,
+                      margin=dict(l=0, r=0, t=30, b=0))
+    return fig
+
+
+def grafico_rotas(matriz, metrica):
+    rotulo = ROTULOS_MAPA[metrica]
+    fig = px.imshow(matriz, color_continuous_scale='Reds', aspect='auto',
+                    labels=dict(x='Estado do cliente', y='Estado do vendedor', color=rotulo),
+                    title=f'{rotulo} por rota (vendedor → cliente)')
+    fig.update_layout(**graficos.TEMA_ESCURO)
+    return fig
+
+
+def grafico_nota_por_status(analise):
+    fig = px.bar(analise, x='status', y='nota', color='status',
+                 color_discrete_map={'No Prazo': '#4ade80', 'Atrasou': '#f87171'},
+                 title='Nota Média por Status de Entrega')
+    fig.update_layout(**graficos.TEMA_ESCURO, showlegend=False)
+    fig.update_yaxes(range=[0, 5])
+    return fig
+
+
+def grafico_atraso_por_tipo(atraso_inter):
+    fig = px.bar(atraso_inter, x='tipo', y='percentual', color='tipo',
+                 color_discrete_map={'Mesmo Estado': '#4ade80', 'Interestadual': '#fbbf24'},
+                 title='% de Atrasos por Tipo de Entrega')
+    fig.update_layout(**graficos.TEMA_ESCURO, showlegend=False, yaxis_title='% Atrasos')
+    return fig
+
+
+def filtros_olist(indice):
+    """Widgets de filtro; devolve {coluna: valores escolhidos} (vazio = sem filtro)."""
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        estados_cliente = st.multiselect("Estado do cliente", indice.valores('estado_cliente'),
+                                         placeholder="Todos")
+    with col2:
+        estados_vendedor = st.multiselect("Estado do vendedor", indice.valores('estado_vendedor'),
+                                          placeholder="Todos")
+    with col3:
+        meses = indice.valores('mes')
+        periodo = []
+        if len(meses) > 1:
+            inicio, fim = st.select_slider("Período", options=meses, value=(meses[0], meses[-1]),
+                                           format_func=str)
+            if (inicio, fim) != (meses[0], meses[-1]):
+                periodo = meses[meses.index(inicio):meses.index(fim) + 1]
+    with col4:
+        notas = st.multiselect("Nota", indice.valores('nota'), placeholder="Todas")
+    return {'estado_cliente': estados_cliente, 'estado_vendedor': estados_vendedor,
+            'mes': periodo, 'nota': notas}
+
+
+def renderizar():
+    st.markdown('<h2 class="section-title">Quando usar cada ferramenta?</h2>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### 📊 Use Power BI quando...")
+        st.markdown("""
+        - 🏢 Precisa de **dashboards corporativos**
+        - 👔 O time é mais **negócio** que dev
+        - 🔐 Precisa de **governança enterprise**
+        - 📈 Quer **relatórios padronizados**
+        - 🤝 Integração forte com Microsoft 365
+        - 📊 Foco é **visualização de KPIs**
+        """)
+
+        with st.expander("📝 Exemplo de cenário Power BI"):
+            st.markdown("""
+            **Cenário:** Diretoria quer ver vendas por região, comparativo mensal,
+            meta vs realizado. Precisa publicar para 50 gerentes com controle de acesso.
+
+            **Por que Power BI:** Governança, publicação em massa, visuais prontos,
+            atualização automática agendada.
+            """)
+
+    with col2:
+        st.markdown("### 🐍 Use Streamlit quando...")
+        st.markdown("""
+        - 🔧 Precisa de **lógica customizada**
+        - 🤖 Quer integrar **ML/IA**
+        - ⚡ Quer **prototipar rápido**
+        - 🎨 Precisa de **experiência única**
+        - 📤 App com **upload/processamento**
+        - 🔄 Automação com Python
+        """)
+
+        with st.expander("📝 Exemplo de cenário Streamlit"):
+            st.markdown("""
+            **Cenário:** Time precisa de ferramenta para fazer upload de planilha Excel,
+            validar dados, aplicar regras de negócio, e exportar resultado processado.
+
+            **Por que Streamlit:** Lógica customizada, manipulação de arquivo,
+            validações específicas, tudo em Python.
+            """)
+
+    st.markdown("---")
+
+    # Cenário do Projeto OLIST
+    st.markdown("### 🛒 Nosso Projeto: Análise OLIST")
+
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #1e3a5f 0%, #2d1b4e 100%); padding: 1.5rem; border-radius: 15px; border: 2px solid #667eea; margin-bottom: 1rem;">
+        <h4 style="color: #ffffff; margin-bottom: 1rem;">🎯 O Desafio</h4>
+        <p style="color: #e0e0e0;">
+            Analisar dados da <strong style="color: #58a6ff;">OLIST</strong> — ecossistema de soluções tecnológicas para varejo
+            (ERP, Hub de integração, logística e financeiro em uma plataforma).
+        </p>
+        <p style="color: #e0e0e0;">
+            <strong>9 perguntas de negócio</strong> para responder com dados reais de e-commerce brasileiro.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### 📋 Os 9 Desafios:")
+        st.markdown("""
+        1. ⏱️ Tempo médio da aprovação até entrega
+        2. 📅 Mês com mais vendas vs mais pagamentos
+        3. ⭐ Análise de satisfação (notas e comentários)
+        4. 🚚 Relação satisfação × prazo de entrega
+        5. 📦 Categorias mais/menos vendidas
+        6. ⚖️ Impacto peso/volume no frete
+        7. 🗺️ Mapa de concentração clientes/vendedores
+        8. 🔄 Atrasos em entregas interestaduais
+        9. 🔁 Padrão dos clientes que fizeram recompra
+        """)
+
+    with col2:
+        st.markdown("#### 🤔 Qual ferramenta usar?")
+
+        st.error("""
+        **Power BI teria dificuldade com:**
+        - ❌ Cálculos de tempo complexos (mediana, distribuições)
+        - ❌ Análise de texto dos comentários
+        - ❌ Correlações estatísticas avançadas
+        - ❌ Mapas customizados com densidade
+        - ❌ Identificar padrões de recompra (requer lógica)
+        """)
+
+        st.success("""
+        **Streamlit resolve com facilidade:**
+        - ✅ Pandas para qualquer cálculo temporal
+        - ✅ Análise de sentimento com Python
+        - ✅ Scipy/Statsmodels para estatística
+        - ✅ Plotly/Folium para mapas interativos
+        - ✅ Lógica Python para padrões complexos
+        """)
+
+    # Demonstração com dados simulados do OLIST
+    st.markdown("---")
+    st.markdown("#### 🔥 Preview: Como ficaria no Streamlit")
+
+    # O GeoJSON do mapa não depende dos dados: começa a carregar já
+    geojson = carregamento.disparar(geojson_brasil)
+
+    # Dados reais da OLIST (se os CSVs estiverem em data/olist) ou simulados
+    with medicao.trecho("olist: dados, cubo e índices"):
+        versao = olist.assinatura()
+        olist_sample, memoria = carregar_olist(versao)
+        celulas = cubo_olist(versao)
+        indice_celulas, indice_linhas = indices_olist(versao)
+    if olist.disponivel():
+        st.caption(f"📦 Dados reais OLIST: {len(olist_sample):,} itens de pedidos entregues e avaliados")
+    else:
+        st.caption(f"🎲 Dados simulados. Coloque os CSVs da OLIST em `{olist.DIRETORIO_PADRAO}` para usar os reais.")
+
+    with st.expander("💾 Memória do DataFrame"):
+        total = memoria.loc['TOTAL']
+        st.markdown(f"**{total['bytes_antes'] / 1024:,.1f} KiB → {total['bytes_depois'] / 1024:,.1f} KiB** "
+                    f"({total['reducao_%']:.0f}% a menos), compartilhado entre todas as sessões.")
+        st.dataframe(memoria, use_container_width=True)
+
+    # Filtros: ORs/ANDs de máscaras pré-computadas, sem varrer as colunas
+    st.markdown("##### 🔎 Filtros")
+    filtros = filtros_olist(indice_celulas)
+    inicio = time.perf_counter()
+    with medicao.trecho("olist: filtros"):
+        mascara = indice_celulas.mascara(filtros)
+        linhas_filtradas = indice_linhas.contar(filtros)
+    st.caption(f"⚡ {linhas_filtradas:,} de {len(olist_sample):,} linhas "
+               f"· filtros aplicados em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Desafio 4: Satisfação × Entrega",
+                                            "🗺️ Desafio 8: Atrasos Interestaduais",
+                                            "📈 Visão Geral", "📍 Mapa", "🗄️ Banco (SQL)"])
+
+    with tab1:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Análise satisfação vs atraso
+            with medicao.trecho("olist: resumo do cubo"):
+                analise = cubo.resumo(celulas, ['entrega_atrasada'], mascara=mascara)[['entrega_atrasada', 'nota']]
+            analise['status'] = analise['entrega_atrasada'].map({True: 'Atrasou', False: 'No Prazo'})
+
+            graficos.exibir(grafico_nota_por_status, analise)
+
+        with col2:
+            st.markdown("**Código Python para esta análise:**")
+            st.code("""
+# Carregar dados
+df = pd.read_sql("SELECT * FROM pedidos", conn)
+
+# Calcular atraso
+df['atrasou'] = df['dias_entrega'] > df['prazo']
+
+# Análise de satisfação por status
+resultado = df.groupby('atrasou')['nota'].agg(['mean', 'median', 'count'])
+
+# Teste estatístico
+from scipy.stats import mannwhitneyu
+stat, pvalue = mannwhitneyu(
+    df[df['atrasou']]['nota'],
+    df[~df['atrasou']]['nota']
+)
+            """, language="python")
+
+        st.markdown("---")
+        paineis = [painel_estatistico(versao, filtros)]
+
+    with tab2:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Análise atrasos interestaduais
+            with medicao.trecho("olist: resumo do cubo"):
+                atraso_inter = cubo.resumo(celulas, ['interestadual'], mascara=mascara)[['interestadual', 'entrega_atrasada']]
+            atraso_inter['tipo'] = atraso_inter['interestadual'].map({True: 'Interestadual', False: 'Mesmo Estado'})
+            atraso_inter['percentual'] = (atraso_inter['entrega_atrasada'] * 100).round(1)
+
+            graficos.exibir(grafico_atraso_por_tipo, atraso_inter)
+
+        with col2:
+            percentuais = dict(zip(atraso_inter['tipo'], atraso_inter['percentual']))
+            for tipo, rotulo in [('Mesmo Estado', "Atrasos Mesmo Estado"), ('Interestadual', "Atrasos Interestaduais")]:
+                st.metric(rotulo, f"{percentuais[tipo]:.1f}%" if tipo in percentuais else "—")
+
+            st.info("💡 Com Streamlit você pode adicionar filtros por estado, período, nota... tudo interativo! Experimente os filtros acima.")
+
+    with tab3:
+        with medicao.trecho("olist: resumo do cubo"):
+            geral = cubo.totais(celulas, mascara=mascara)
+        if geral['n'] == 0:
+            st.warning("Nenhum pedido com esses filtros.")
+        else:
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Total Pedidos", f"{int(geral['n']):,}")
+            with col2:
+                st.metric("Ticket Médio", f"R$ {geral['valor_pedido']:.2f}")
+            with col3:
+                st.metric("Nota Média", f"{geral['nota']:.1f} ⭐")
+            with col4:
+                st.metric("% Atrasos", f"{geral['entrega_atrasada']*100:.1f}%")
+
+        # Linhas que passam nos filtros, direto da máscara bitmap (só as primeiras vão ao navegador)
+        linhas = indice_linhas.mascara(filtros)
+        posicoes = np.arange(len(olist_sample)) if linhas is None else np.flatnonzero(linhas)
+        st.markdown(f"**📋 Pedidos filtrados** (primeiros {min(len(posicoes), 1000):,} de {len(posicoes):,})")
+        st.dataframe(olist_sample.iloc[posicoes[:1000]], use_container_width=True, hide_index=True)
+
+    with tab4:
+        paineis.append(mapa_atrasos(celulas, mascara, geojson))
+
+    with tab5:
+        paineis.append(consulta_sql(versao, olist_sample, filtros))
+
+    # Os painéis lentos são desenhados na ordem em que os dados chegam
+    carregamento.preencher(paineis)
+
+    st.markdown("---")
+
+    st.success("""
+    ### 🏆 Veredicto para o Projeto OLIST:
+
+    **Streamlit é a escolha ideal** porque:
+    - 📊 **Análises estatísticas** complexas (medianas, correlações, testes)
+    - 📝 **Processamento de texto** para comentários de satisfação
+    - 🗺️ **Mapas interativos** para visualização geográfica
+    - 🔄 **Lógica de negócio** para identificar padrões de recompra
+    - 🎯 **Apresentação profissional** para os desafios em sala
+
+    *Power BI seria viável para visualizações simples, mas limitado nos desafios mais analíticos.*
+    """)
+
+    st.markdown("---")
+
+    # Quiz interativo
+    st.markdown("### 🎮 Mini Quiz: Qual ferramenta você usaria?")
+
+    cenario = st.selectbox(
+        "Escolha um cenário:",
+        [
+            "Selecione um cenário...",
+            "Dashboard de vendas para diretoria com 100 usuários",
+            "App que recebe foto e classifica com IA",
+            "Relatório de RH com dados sensíveis e governança",
+            "Ferramenta interna para calcular comissões complexas",
+            "Protótipo rápido para validar ideia de produto"
+        ]
+    )
+
+    if cenario != "Selecione um cenário...":
+        respostas = {
+            "Dashboard de vendas para diretoria com 100 usuários": ("Power BI", "Governança, publicação em massa, visuais prontos"),
+            "App que recebe foto e classifica com IA": ("Streamlit", "Integração com bibliotecas de ML/IA em Python"),
+            "Relatório de RH com dados sensíveis e governança": ("Power BI", "Controle de acesso robusto e governança enterprise"),
+            "Ferramenta interna para calcular comissões complexas": ("Streamlit", "Lógica de negócio complexa é mais fácil em Python"),
+            "Protótipo rápido para validar ideia de produto": ("Streamlit", "Velocidade de desenvolvimento e iteração")
+        }
+
+        resp, motivo = respostas[cenario]
+        if resp == "Power BI":
+            st.warning(f"📊 **Power BI** seria a melhor escolha!\n\n*Motivo: {motivo}*")
+        else:
+            st.success(f"🐍 **Streamlit** seria a melhor escolha!\n\n*Motivo: {motivo}*")
@@ -0,0 +1,91 @@
+"""
+Página: Streamlit vs Power BI
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from componentes import graficos
+
+
+def grafico_comparacao(comparacao):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='Streamlit', x=comparacao["Critério"], y=comparacao["Streamlit"],
+                         marker_color='#306998'))
+    fig.add_trace(go.Bar(name='Power BI', x=comparacao["Critério"], y=comparacao["Power BI"],
+                         marker_color='#F2C811'))
+    fig.update_layout(barmode='group', height=400,
+                      yaxis_title="Nota (1-5)",
+                      legend=dict(orientation="h", yanchor="bottom", y=1.02))
+    return fig
+
+
+def renderizar():
+    st.markdown('<h2 class="section-title">Streamlit vs Power BI</h2>', unsafe_allow_html=True)
+
+    st.markdown("### 🎭 Filosofias diferentes para problemas parecidos")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="compare-python">
+            <h3>🐍 Streamlit</h3>
+            <p><strong>"Código-first"</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        #### Vantagens:
+        - ✅ Flexibilidade total (é Python!)
+        - ✅ Integra com ML, automação, APIs
+        - ✅ Lógica complexa sem sofrer
+        - ✅ Qualquer biblioteca Python
+        - ✅ Controle total da experiência
+        - ✅ Gratuito e open source
+
+        #### Desvantagens:
+        - ⚠️ Precisa programar
+        - ⚠️ Menos "pronto" para BI corporativo
+        - ⚠️ Governança você constrói
+        """)
+
+    with col2:
+        st.markdown("""
+        <div class="compare-powerbi">
+            <h3>📊 Power BI</h3>
+            <p><strong>"Visual-first"</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        #### Vantagens:
+        - ✅ Drag-and-drop (low-code)
+        - ✅ Visuais prontos e bonitos
+        - ✅ Power Query para ETL
+        - ✅ DAX para métricas
+        - ✅ Publicação corporativa robusta
+        - ✅ Governança enterprise
+
+        #### Desvantagens:
+        - ⚠️ DAX pode virar pesadelo
+        - ⚠️ Customização limitada
+        - ⚠️ Integração ML é trabalhosa
+        """)
+
+    st.markdown("---")
+
+    # Comparação visual
+    st.markdown("### 📊 Comparação lado a lado")
+
+    comparacao = pd.DataFrame({
+        "Critério": ["Curva de aprendizado", "Flexibilidade", "Visuais prontos",
+                     "Integração ML", "Deploy corporativo", "Custo"],
+        "Streamlit": [4, 5, 3, 5, 3, 5],
+        "Power BI": [3, 3, 5, 2, 5, 3]
+    })
+
+    graficos.exibir(grafico_comparacao, comparacao)
+
+    st.info("💡 **Nota:** Esta comparação é subjetiva e depende do contexto de uso!")